@@ -9,12 +9,15 @@ from __future__ import annotations
 
 import argparse
 import csv
+import functools
 import json
 import math
 import re
+import string
+import sys
 from collections import defaultdict
 from pathlib import Path
-from typing import Any, Dict, List, Set, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 try:
     from rapidfuzz import fuzz, process
@@ -28,17 +31,65 @@ try:
 except ImportError:
     HAS_THEFUZZ = False
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = HAS_NUMPY
+except ImportError:
+    HAS_NUMBA = False
+
 
 _WORD_RE = re.compile(r"[a-z0-9]+")
 
+# ASCII fast path: map every character outside [a-z0-9] to a space
+_KEEP = set(string.ascii_lowercase + string.digits)
+_ASCII_TABLE = str.maketrans({chr(i): " " for i in range(128) if chr(i) not in _KEEP})
 
+
+@functools.lru_cache(maxsize=65536)
 def normalize(text: str) -> str:
-    """Normalize text for matching."""
+    """Normalize text for matching.
+    
+    Memoized: token vocabularies and name variants repeat heavily.
+    """
     text = text.lower()
+    if text.isascii():
+        return " ".join(text.translate(_ASCII_TABLE).split())
     parts = _WORD_RE.findall(text)
     return " ".join(parts).strip()
 
 
+def _loads(data: bytes) -> Any:
+    """Parse JSON from bytes, using orjson when available.
+
+    Falls back to json for input only it accepts, such as bare NaN/Infinity.
+    """
+    if HAS_ORJSON:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize to compact JSON text (non-ASCII kept), using orjson when available."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False)
+
+
 def load_tokens_csv(path: Path) -> Dict[int, List[Dict[str, Any]]]:
     """Load tokens CSV and group by pass number."""
     passes: Dict[int, List[Dict[str, Any]]] = defaultdict(list)
@@ -66,21 +117,25 @@ def load_players(path: Path) -> Tuple[Dict[str, List[dict]], List[str]]:
     players_by_name: Dict[str, List[dict]] = {}
     all_names: Set[str] = set()
     
-    for line in path.read_text(encoding="utf-8").splitlines():
+    rows: List[dict] = []
+    for line in path.read_bytes().splitlines():
         line = line.strip()
         if not line:
             continue
         try:
-            obj = json.loads(line)
-        except json.JSONDecodeError:
+            obj = _loads(line)
+        except ValueError:
             continue
         
+        if obj.get("name") or obj.get("full_name"):
+            rows.append(obj)
+    
+    # Compute career-based scores for the whole database at once
+    for obj, career_score in zip(rows, compute_career_scores(rows)):
+        obj["_career_score"] = career_score
+    
+    for obj in rows:
         name = obj.get("name") or obj.get("full_name")
-        if not name:
-            continue
-        
-        # Compute career-based score
-        obj["_career_score"] = compute_career_score(obj)
         
         # Collect all name variants
         names = [name]
@@ -113,7 +168,7 @@ def load_players(path: Path) -> Tuple[Dict[str, List[dict]], List[str]]:
 
 
 # League tier weights (higher = more prestigious)
-LEAGUE_WEIGHTS = {
+LEAGUE_WEIGHTS = {sys.intern(k): v for k, v in {
     # Top 5 leagues
     "eng premier league": 100, "premier league": 100, "english premier league": 100, "gb1": 100,
     "es la liga": 95, "la liga": 95, "es1": 95,
@@ -131,10 +186,10 @@ LEAGUE_WEIGHTS = {
     "europa league": 80,
     "world cup": 150,
     "euro": 130,
-}
+}.items()}
 
 # Club prestige weights
-CLUB_WEIGHTS = {
+CLUB_WEIGHTS = {sys.intern(k): v for k, v in {
     # English
     "manchester city": 95, "manchester city football club": 95,
     "liverpool": 95, "liverpool fc": 95,
@@ -155,7 +210,14 @@ CLUB_WEIGHTS = {
     "ac milan": 85, "milan": 85,
     # French
     "paris saint-germain": 90, "psg": 90,
-}
+}.items()}
+
+# Integer ids into the weight tables (used by the vectorized scorer)
+_CLUB_IDS = {name: idx for idx, name in enumerate(CLUB_WEIGHTS)}
+_LEAGUE_IDS = {name: idx for idx, name in enumerate(LEAGUE_WEIGHTS)}
+if HAS_NUMPY:
+    _CLUB_WEIGHT_ARR = np.fromiter(CLUB_WEIGHTS.values(), dtype=np.float64, count=len(CLUB_WEIGHTS))
+    _LEAGUE_WEIGHT_ARR = np.fromiter(LEAGUE_WEIGHTS.values(), dtype=np.float64, count=len(LEAGUE_WEIGHTS))
 
 
 def compute_career_score(player: dict) -> float:
@@ -174,23 +236,19 @@ def compute_career_score(player: dict) -> float:
     current_club = (player.get("club") or "").lower()
     score += CLUB_WEIGHTS.get(current_club, 30)  # Default 30 for unknown clubs
     
-    # Historical clubs
+    # Historical clubs contribute 30% of their weight
     clubs = player.get("clubs") or []
-    for club in clubs:
-        club_lower = club.lower()
-        club_score = CLUB_WEIGHTS.get(club_lower, 20)
-        score += club_score * 0.3  # Historical clubs contribute 30% of their weight
+    if clubs:
+        score += 0.3 * sum([CLUB_WEIGHTS.get(club.lower(), 20) for club in clubs])
     
     # Current league weight
     current_league = (player.get("league") or "").lower()
     score += LEAGUE_WEIGHTS.get(current_league, 20)
     
-    # Historical leagues
+    # Historical leagues contribute 20%
     leagues = player.get("leagues") or []
-    for league in leagues:
-        league_lower = league.lower()
-        league_score = LEAGUE_WEIGHTS.get(league_lower, 15)
-        score += league_score * 0.2  # Historical leagues contribute 20%
+    if leagues:
+        score += 0.2 * sum([LEAGUE_WEIGHTS.get(league.lower(), 15) for league in leagues])
     
     # Minutes played (experience factor)
     minutes = player.get("minutes_played") or 0
@@ -214,6 +272,69 @@ def compute_career_score(player: dict) -> float:
     return round(score, 2)
 
 
+def compute_career_scores(players: List[dict]) -> List[float]:
+    """Compute career scores for a list of players in one vectorized pass.
+    
+    Produces the same values as compute_career_score, but gathers the fields
+    into NumPy arrays so the weight lookups and arithmetic run column-wise.
+    Falls back to the per-player function when NumPy is not installed.
+    """
+    if not HAS_NUMPY or not players:
+        return [compute_career_score(p) for p in players]
+    
+    n = len(players)
+    # Unknown clubs/leagues map to the trailing slot holding the default weight
+    club_ids = _CLUB_IDS
+    league_ids = _LEAGUE_IDS
+    club_w = _CLUB_WEIGHT_ARR
+    league_w = _LEAGUE_WEIGHT_ARR
+    unknown_club = len(club_ids)
+    unknown_league = len(league_ids)
+    
+    current_club = np.empty(n, dtype=np.intp)
+    current_league = np.empty(n, dtype=np.intp)
+    minutes = np.zeros(n, dtype=np.float64)
+    contribution = np.zeros(n, dtype=np.float64)
+    coverage = np.zeros(n, dtype=np.float64)
+    hist_clubs: List[int] = []
+    hist_club_owner: List[int] = []
+    hist_leagues: List[int] = []
+    hist_league_owner: List[int] = []
+    
+    for i, player in enumerate(players):
+        current_club[i] = club_ids.get((player.get("club") or "").lower(), unknown_club)
+        current_league[i] = league_ids.get((player.get("league") or "").lower(), unknown_league)
+        for club in player.get("clubs") or []:
+            hist_clubs.append(club_ids.get(club.lower(), unknown_club))
+            hist_club_owner.append(i)
+        for league in player.get("leagues") or []:
+            hist_leagues.append(league_ids.get(league.lower(), unknown_league))
+            hist_league_owner.append(i)
+        minutes[i] = player.get("minutes_played") or 0
+        contribution[i] = (player.get("goals") or 0) * 1.5 + (player.get("assists") or 0) * 1.0
+        sources = player.get("sources") or []
+        coverage[i] = len(sources) * 5 + (30 if "worldcup" in sources else 0)
+    
+    score = np.append(club_w, 30.0)[current_club]
+    score += 0.3 * np.bincount(
+        np.asarray(hist_club_owner, dtype=np.intp),
+        weights=np.append(club_w, 20.0)[np.asarray(hist_clubs, dtype=np.intp)],
+        minlength=n,
+    )
+    score += np.append(league_w, 20.0)[current_league]
+    score += 0.2 * np.bincount(
+        np.asarray(hist_league_owner, dtype=np.intp),
+        weights=np.append(league_w, 15.0)[np.asarray(hist_leagues, dtype=np.intp)],
+        minlength=n,
+    )
+    played = minutes > 0
+    score[played] += np.minimum(25, np.log10(minutes[played] + 1) * 8)
+    score += contribution
+    score += coverage
+    
+    return [round(float(v), 2) for v in score]
+
+
 def fuzzy_match(query: str, choices: List[str], limit: int = 5, threshold: int = 70) -> List[Tuple[str, int]]:
     """Find fuzzy matches for a query string.
     
@@ -230,6 +351,8 @@ def fuzzy_match(query: str, choices: List[str], limit: int = 5, threshold: int =
         # Use WRatio for better matching
         results = thefuzz_process.extract(query, choices, scorer=thefuzz_fuzz.WRatio, limit=limit)
         return [(name, score) for name, score in results if score >= threshold]
+    elif HAS_NUMBA and query.isascii():
+        return _fallback_match_numba(query.lower(), choices, limit)
     else:
         # Fallback: exact prefix/substring matching + 1-char difference tolerance
         matches = []
@@ -247,6 +370,68 @@ def fuzzy_match(query: str, choices: List[str], limit: int = 5, threshold: int =
         return sorted(matches, key=lambda x: -x[1])[:limit]
 
 
+if HAS_NUMBA:
+    @njit(cache=True)
+    def _contains(hay, h_start, h_end, needle, n_start, n_end):
+        """Return True if needle[n_start:n_end] occurs in hay[h_start:h_end]."""
+        n_len = n_end - n_start
+        for i in range(h_start, h_end - n_len + 1):
+            j = 0
+            while j < n_len and hay[i + j] == needle[n_start + j]:
+                j += 1
+            if j == n_len:
+                return True
+        return False
+
+    @njit(cache=True, parallel=True)
+    def _fallback_scores(query, choices_flat, offsets):
+        """Score every choice with the fallback rules (100 / 85 / 75 / 0)."""
+        q_len = query.shape[0]
+        n = offsets.shape[0] - 1
+        scores = np.zeros(n, dtype=np.uint8)
+        for i in prange(n):
+            start = offsets[i]
+            end = offsets[i + 1]
+            c_len = end - start
+            diff = 0
+            if c_len == q_len:
+                for j in range(q_len):
+                    if query[j] != choices_flat[start + j]:
+                        diff += 1
+                if diff == 0:
+                    scores[i] = 100
+                    continue
+            if _contains(choices_flat, start, end, query, 0, q_len) or _contains(
+                query, 0, q_len, choices_flat, start, end
+            ):
+                scores[i] = 85
+            elif c_len == q_len and q_len <= 5 and diff == 1:
+                scores[i] = 75
+        return scores
+
+
+# Encoded choices for the numba fallback, reused while the same list is passed in
+_ENCODED_CHOICES: Dict[str, Any] = {}
+
+
+def _fallback_match_numba(query_lower: str, choices: List[str], limit: int) -> List[Tuple[str, int]]:
+    """Numba-compiled version of the no-rapidfuzz fallback in fuzzy_match."""
+    if _ENCODED_CHOICES.get("choices") is not choices:
+        encoded = [c.encode("ascii", "replace") for c in choices]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(c) for c in encoded], out=offsets[1:])
+        _ENCODED_CHOICES["choices"] = choices
+        _ENCODED_CHOICES["flat"] = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+        _ENCODED_CHOICES["offsets"] = offsets
+    
+    query = np.frombuffer(query_lower.encode("ascii"), dtype=np.uint8)
+    scores = _fallback_scores(query, _ENCODED_CHOICES["flat"], _ENCODED_CHOICES["offsets"])
+    hits = np.flatnonzero(scores)
+    # Stable sort keeps choice order among equal scores, like the Python fallback
+    hits = hits[np.argsort(-scores[hits].astype(np.int16), kind="stable")][:limit]
+    return [(choices[i], int(scores[i])) for i in hits]
+
+
 def build_ngrams(tokens: List[Dict], min_n: int, max_n: int) -> List[Tuple[str, int, int, List[Dict]]]:
     """Build n-grams from token list.
     
@@ -265,6 +450,36 @@ def build_ngrams(tokens: List[Dict], min_n: int, max_n: int) -> List[Tuple[str,
     return ngrams
 
 
+def precompute_fuzzy_matches(
+    queries: List[str],
+    choices: List[str],
+    limit: int,
+    threshold: int,
+) -> Dict[str, List[Tuple[str, int]]]:
+    """Fuzzy-match many queries at once with rapidfuzz's cdist.
+    
+    Returns the same (matched_name, score) lists fuzzy_match would, keyed by
+    query. Returns an empty dict when rapidfuzz or NumPy is unavailable.
+    """
+    if not (HAS_RAPIDFUZZ and HAS_NUMPY) or not queries or not choices:
+        return {}
+    
+    results: Dict[str, List[Tuple[str, int]]] = {}
+    # Bound the score matrix to ~4M cells per block
+    block_size = max(1, (1 << 22) // len(choices))
+    for start in range(0, len(queries), block_size):
+        block = queries[start:start + block_size]
+        scores = process.cdist(
+            block, choices, scorer=fuzz.WRatio, score_cutoff=threshold,
+            dtype=np.float64, workers=-1,
+        )
+        for query, row in zip(block, scores):
+            hits = np.flatnonzero(row >= threshold)
+            hits = hits[np.argsort(-row[hits], kind="stable")[:limit]]
+            results[query] = [(choices[i], int(row[i])) for i in hits]
+    return results
+
+
 def process_pass(
     pass_num: int,
     tokens: List[Dict],
@@ -276,12 +491,16 @@ def process_pass(
     max_suggestions: int,
     search_cache: Dict[str, List[Dict]],
     debug: bool = False,
+    fuzzy_results: Optional[Dict[str, List[Tuple[str, int]]]] = None,
 ) -> List[Dict]:
     """Process a single pass and return match suggestions.
     
     Args:
         search_cache: Shared cache mapping ngram -> list of suggestions.
                       Avoids redundant searches across passes.
+        fuzzy_results: Optional precomputed fuzzy matches per ngram
+                       (see precompute_fuzzy_matches); missing ngrams
+                       fall back to fuzzy_match.
     
     Returns list of match records with multiple player suggestions.
     """
@@ -303,15 +522,17 @@ def process_pass(
             suggestions = search_cache[chunk]
             cache_hits += 1
             if debug and suggestions:
-                print(f"[debug] Pass {pass_num}: '{chunk}' -> CACHE HIT ({len(suggestions)} suggestions)")
+                print(f"[debug] Pass {pass_num}: '{chunk}' -> CACHE HIT ({len(suggestions)} suggestions)", file=sys.stderr)
         else:
             suggestions = []
+            seen_names: Set[str] = set()
             
             # 1. Exact match
             exact_players = players_by_name.get(chunk, [])
             for player in exact_players[:max_suggestions]:
                 name = player.get("name") or player.get("full_name")
                 career_score = player.get("_career_score") or 0.0
+                seen_names.add(name.lower())
                 suggestions.append({
                     "name": name,
                     "match_type": "exact",
@@ -329,18 +550,22 @@ def process_pass(
             
             # 2. Fuzzy match (if no exact or want more suggestions)
             if len(suggestions) < max_suggestions:
-                fuzzy_matches = fuzzy_match(chunk, all_names, limit=max_suggestions * 2, threshold=fuzzy_threshold)
+                if fuzzy_results is not None and chunk in fuzzy_results:
+                    fuzzy_matches = fuzzy_results[chunk]
+                else:
+                    fuzzy_matches = fuzzy_match(chunk, all_names, limit=max_suggestions * 2, threshold=fuzzy_threshold)
                 for matched_name, score in fuzzy_matches:
                     # Skip if already suggested via exact match
-                    if any(s["name"].lower() == matched_name.lower() for s in suggestions):
+                    if matched_name.lower() in seen_names:
                         continue
                     
                     players = players_by_name.get(matched_name, [])
                     for player in players[:2]:  # Top 2 players per fuzzy match
                         name = player.get("name") or player.get("full_name")
-                        if any(s["name"].lower() == name.lower() for s in suggestions):
+                        if name.lower() in seen_names:
                             continue
                         career_score = player.get("_career_score") or 0.0
+                        seen_names.add(name.lower())
                         suggestions.append({
                             "name": name,
                             "match_type": "fuzzy",
@@ -383,14 +608,30 @@ def process_pass(
             
             if debug and chunk not in search_cache:
                 top_names = [f"{s['name']} ({s['career_score']:.1f})" for s in suggestions[:3]]
-                print(f"[debug] Pass {pass_num}: '{chunk}' -> {top_names}")
+                print(f"[debug] Pass {pass_num}: '{chunk}' -> {top_names}", file=sys.stderr)
     
     if debug:
-        print(f"[debug] Pass {pass_num}: {cache_hits} cache hits")
+        print(f"[debug] Pass {pass_num}: {cache_hits} cache hits", file=sys.stderr)
     
     return matches
 
 
+def _unique_by_career_score(keys: List[str], players: List[Dict]) -> Dict[str, Dict]:
+    """Keep the highest career-score player per key (earliest wins ties).
+    
+    Keys stay in first-appearance order, so the stable sort by career score
+    in main() orders ties as before.
+    """
+    unique: Dict[str, Dict] = {}
+    best: Dict[str, float] = {}
+    for key, player in zip(keys, players):
+        score = player.get("career_score", 0) or 0
+        if key not in best or score > best[key]:
+            unique[key] = player
+            best[key] = score
+    return unique
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description="Match ASR tokens to player names with fuzzy matching")
     parser.add_argument("tokens_csv", help="Stage-1 tokens CSV file")
@@ -414,104 +655,110 @@ def main() -> int:
         raise SystemExit("No tokens found in CSV.")
     
     if args.debug:
-        print(f"[debug] Loaded {len(passes)} passes from {args.tokens_csv}")
+        print(f"[debug] Loaded {len(passes)} passes from {args.tokens_csv}", file=sys.stderr)
         for pass_num, tokens in passes.items():
-            print(f"[debug]   Pass {pass_num}: {len(tokens)} tokens")
+            print(f"[debug]   Pass {pass_num}: {len(tokens)} tokens", file=sys.stderr)
     
     # Load player database
     players_by_name, all_names = load_players(Path(args.players))
     if args.debug:
-        print(f"[debug] Loaded {len(all_names)} unique player name variants")
+        print(f"[debug] Loaded {len(all_names)} unique player name variants", file=sys.stderr)
     
     # Shared search cache across all passes
     search_cache: Dict[str, List[Dict]] = {}
     
-    # Process each pass independently
-    all_matches = []
-    for pass_num in sorted(passes.keys()):
-        tokens = passes[pass_num]
-        matches = process_pass(
-            pass_num=pass_num,
-            tokens=tokens,
-            players_by_name=players_by_name,
-            all_names=all_names,
-            min_gram=args.min_gram,
-            max_gram=args.max_gram,
-            fuzzy_threshold=args.fuzzy_threshold,
-            max_suggestions=args.max_suggestions,
-            search_cache=search_cache,
-            debug=args.debug,
-        )
-        all_matches.extend(matches)
+    # Fuzzy-match the union of all passes' n-grams in one batch
+    queries: Dict[str, None] = {}
+    for tokens in passes.values():
+        for chunk, _, _, _ in build_ngrams(tokens, args.min_gram, args.max_gram):
+            if len(players_by_name.get(chunk, [])) < args.max_suggestions:
+                queries[chunk] = None
+    fuzzy_results = precompute_fuzzy_matches(
+        list(queries), all_names, limit=args.max_suggestions * 2, threshold=args.fuzzy_threshold
+    )
+    if args.debug and fuzzy_results:
+        print(f"[debug] Precomputed fuzzy matches for {len(fuzzy_results)} n-grams", file=sys.stderr)
+    
+    # Stream the output envelope; match records are written as each pass finishes
+    out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    out.write('{"source_csv": %s, "num_passes": %d, "matches": [' % (
+        _dumps(str(args.tokens_csv)), len(passes)))
+    
+    total_matches = 0
+    candidate_keys: List[str] = []
+    candidate_players: List[Dict] = []
+    mention_counts: Dict[str, Tuple[int, float]] = {}
+    try:
+        # Process each pass independently
+        for pass_num in sorted(passes.keys()):
+            tokens = passes[pass_num]
+            matches = process_pass(
+                pass_num=pass_num,
+                tokens=tokens,
+                players_by_name=players_by_name,
+                all_names=all_names,
+                min_gram=args.min_gram,
+                max_gram=args.max_gram,
+                fuzzy_threshold=args.fuzzy_threshold,
+                max_suggestions=args.max_suggestions,
+                search_cache=search_cache,
+                debug=args.debug,
+                fuzzy_results=fuzzy_results,
+            )
+            for match in matches:
+                out.write(",\n" if total_matches else "\n")
+                out.write(_dumps(match))
+                total_matches += 1
+                
+                # Collect player candidates across all matches
+                for suggestion in match.get("suggestions", []):
+                    player = suggestion.get("player", {})
+                    name = player.get("name", "")
+                    if name:
+                        candidate_keys.append(name.lower())
+                        candidate_players.append(player)
+                
+                if args.debug:
+                    for suggestion in match.get("suggestions", []):
+                        name = suggestion.get("name", "")
+                        career = suggestion.get("career_score") or 0.0
+                        if name:
+                            if name not in mention_counts:
+                                mention_counts[name] = (0, career)
+                            mention_counts[name] = (mention_counts[name][0] + 1, max(mention_counts[name][1], career))
+        
+        unique_players = _unique_by_career_score(candidate_keys, candidate_players)
+        out.write('\n], "total_matches": %d, "unique_players": %d}\n' % (total_matches, len(unique_players)))
+    finally:
+        if out is not sys.stdout:
+            out.close()
     
     if args.debug:
-        print(f"[debug] Search cache size: {len(search_cache)} entries")
-    
-    # Collect unique player candidates across all matches
-    unique_players: Dict[str, Dict] = {}
-    for match in all_matches:
-        for suggestion in match.get("suggestions", []):
-            player = suggestion.get("player", {})
-            name = player.get("name", "")
-            if not name:
-                continue
-            key = name.lower()
-            if key not in unique_players:
-                unique_players[key] = player
-            else:
-                # Update with higher career score if available
-                if player.get("career_score", 0) > unique_players[key].get("career_score", 0):
-                    unique_players[key] = player
-    
-    # Build output payload
-    payload = {
-        "source_csv": str(args.tokens_csv),
-        "num_passes": len(passes),
-        "total_matches": len(all_matches),
-        "unique_players": len(unique_players),
-        "matches": all_matches,
-    }
-    
-    # Write main output
-    output = json.dumps(payload, ensure_ascii=False, indent=2)
-    if args.output:
-        Path(args.output).write_text(output + "\n", encoding="utf-8")
-        if args.debug:
-            print(f"[debug] Wrote {len(all_matches)} matches to {args.output}")
-    else:
-        print(output)
+        print(f"[debug] Search cache size: {len(search_cache)} entries", file=sys.stderr)
+        if args.output:
+            print(f"[debug] Wrote {total_matches} matches to {args.output}", file=sys.stderr)
     
     # Write unique players JSONL for stage3
     if args.players_output:
         players_list = sorted(unique_players.values(), key=lambda p: p.get("career_score", 0), reverse=True)
         with open(args.players_output, "w", encoding="utf-8") as f:
             for player in players_list:
-                f.write(json.dumps(player, ensure_ascii=False) + "\n")
+                f.write(_dumps(player) + "\n")
         if args.debug:
-            print(f"[debug] Wrote {len(players_list)} unique player candidates to {args.players_output}")
+            print(f"[debug] Wrote {len(players_list)} unique player candidates to {args.players_output}", file=sys.stderr)
     
     # Print summary
     if args.debug:
-        print(f"\n[summary]")
-        print(f"  Passes processed: {len(passes)}")
-        print(f"  Total matches: {len(all_matches)}")
-        print(f"  Unique players: {len(unique_players)}")
+        print(f"\n[summary]", file=sys.stderr)
+        print(f"  Passes processed: {len(passes)}", file=sys.stderr)
+        print(f"  Total matches: {total_matches}", file=sys.stderr)
+        print(f"  Unique players: {len(unique_players)}", file=sys.stderr)
         
         # Show top players by mention count with career scores
-        mention_counts: Dict[str, Tuple[int, float]] = {}
-        for match in all_matches:
-            for suggestion in match.get("suggestions", []):
-                name = suggestion.get("name", "")
-                career = suggestion.get("career_score") or 0.0
-                if name:
-                    if name not in mention_counts:
-                        mention_counts[name] = (0, career)
-                    mention_counts[name] = (mention_counts[name][0] + 1, max(mention_counts[name][1], career))
-        
         top_mentioned = sorted(mention_counts.items(), key=lambda x: -x[1][0])[:15]
-        print(f"  Top mentioned players:")
+        print(f"  Top mentioned players:", file=sys.stderr)
         for name, (count, career) in top_mentioned:
-            print(f"    {name} (career: {career:.1f}): {count} mentions")
+            print(f"    {name} (career: {career:.1f}): {count} mentions", file=sys.stderr)
     
     return 0
 
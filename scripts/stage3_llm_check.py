@@ -3,11 +3,20 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
+import hashlib
 import importlib
 import json
+import sqlite3
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 
 def load_llm_client(path: str) -> Any:
     module_name, _, class_name = path.partition(":")
@@ -28,30 +37,107 @@ def build_prompt(question: str, name: str) -> str:
     )
 
 
+class ResponseCache:
+    """SQLite-backed store of LLM responses keyed by (client, question, name)."""
+
+    def __init__(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path))
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, response TEXT NOT NULL)"
+        )
+
+    @staticmethod
+    def key(client: str, question: str, name: str) -> str:
+        raw = f"{client}||{question}||{name}".encode("utf-8")
+        return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        row = self._conn.execute("SELECT response FROM responses WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def put(self, key: str, response: str) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO responses (key, response) VALUES (?, ?)", (key, response)
+        )
+        self._conn.commit()
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+async def _ask_concurrently(llm: Any, prompts: List[str], concurrency: int) -> List[Optional[str]]:
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def ask_one(prompt: str) -> Optional[str]:
+        async with semaphore:
+            if hasattr(llm, "ask_async"):
+                return await llm.ask_async(prompt)
+            return await asyncio.to_thread(llm.ask, prompt)
+
+    return list(await asyncio.gather(*(ask_one(p) for p in prompts)))
+
+
+def ask_all(llm: Any, prompts: List[str], concurrency: int = 8) -> List[Optional[str]]:
+    """Ask the LLM every prompt, returning responses in prompt order.
+
+    Prefers a client-provided ask_batch(prompts); otherwise issues the calls
+    concurrently (ask_async if available, else ask in worker threads).
+    """
+    if not prompts:
+        return []
+    if hasattr(llm, "ask_batch"):
+        return list(llm.ask_batch(prompts))
+    return asyncio.run(_ask_concurrently(llm, prompts, concurrency))
+
+
 def main() -> int:
     parser = argparse.ArgumentParser()
     parser.add_argument("candidates_json", help="Stage-2 candidates JSON output")
     parser.add_argument("question", help="Constraint question to evaluate")
     parser.add_argument("--llm-client", help="Import path module:Class for an LLM client")
     parser.add_argument("--output", help="Write responses to a JSON file")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=8,
+        help="Max LLM requests in flight (default: 8)",
+    )
+    parser.add_argument(
+        "--cache",
+        default=".cache/llm_responses.sqlite",
+        help="SQLite file caching LLM responses across runs",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Always call the LLM")
     args = parser.parse_args()
 
-    payload = json.loads(Path(args.candidates_json).read_text(encoding="utf-8"))
+    raw = Path(args.candidates_json).read_bytes()
+    payload = orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
     candidates = payload.get("candidates", [])
 
     llm = None
     if args.llm_client:
         llm = load_llm_client(args.llm_client)
 
+    names = [entry.get("name") for entry in candidates if entry.get("name")]
+    prompts = [build_prompt(args.question, name) for name in names]
+    answers: List[Optional[str]] = [None] * len(prompts)
+    if llm is not None:
+        cache = None if args.no_cache else ResponseCache(Path(args.cache))
+        keys = [ResponseCache.key(args.llm_client, args.question, name) for name in names]
+        if cache is not None:
+            answers = [cache.get(key) for key in keys]
+        missing = [i for i, answer in enumerate(answers) if answer is None]
+        fresh = ask_all(llm, [prompts[i] for i in missing], args.concurrency)
+        for i, response in zip(missing, fresh):
+            answers[i] = response
+            if cache is not None and response is not None:
+                cache.put(keys[i], response)
+        if cache is not None:
+            cache.close()
+
     responses: List[Dict[str, Any]] = []
-    for entry in candidates:
-        name = entry.get("name")
-        if not name:
-            continue
-        prompt = build_prompt(args.question, name)
-        response: Optional[str] = None
-        if llm is not None:
-            response = llm.ask(prompt)
+    for name, prompt, response in zip(names, prompts, answers):
         responses.append(
             {
                 "name": name,
@@ -66,7 +152,10 @@ def main() -> int:
         "responses": responses,
     }
 
-    output = json.dumps(output_payload, ensure_ascii=True, indent=2)
+    if HAS_ORJSON:
+        output = orjson.dumps(output_payload, option=orjson.OPT_INDENT_2).decode("utf-8")
+    else:
+        output = json.dumps(output_payload, ensure_ascii=False, indent=2)
     if args.output:
         Path(args.output).write_text(output + "\n", encoding="utf-8")
     else:
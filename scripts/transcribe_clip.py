@@ -5,9 +5,11 @@ from __future__ import annotations
 import argparse
 import json
 import subprocess
-import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import numpy as np
+
 
 def parse_timestamp(ts: str) -> float:
     parts = ts.split(":")
@@ -37,14 +39,16 @@ def build_atempo_chain(speed: float) -> str:
 
 def extract_audio(
     video_path: str,
-    output_path: str,
     start: str,
     end: str,
     slowdown: float,
-) -> None:
-    cmd = ["ffmpeg", "-y", "-i", video_path]
+) -> np.ndarray:
+    """Decode the clip to 16 kHz mono float32 PCM, read straight from ffmpeg's stdout."""
+    cmd = ["ffmpeg", "-y"]
     if start:
-        cmd.extend(["-ss", str(parse_timestamp(start))])
+        # Input-side seek: ffmpeg jumps to the nearest keyframe, then decodes accurately.
+        cmd.extend(["-accurate_seek", "-ss", str(parse_timestamp(start))])
+    cmd.extend(["-i", video_path])
     if end:
         start_sec = parse_timestamp(start) if start else 0
         end_sec = parse_timestamp(end)
@@ -52,8 +56,11 @@ def extract_audio(
         cmd.extend(["-t", str(duration)])
     if slowdown != 1.0:
         cmd.extend(["-af", build_atempo_chain(slowdown)])
-    cmd.extend(["-ar", "16000", "-ac", "1", output_path])
-    subprocess.run(cmd, check=True, capture_output=True)
+    # Audio only; let ffmpeg use all cores for decoding.
+    cmd.extend(["-vn", "-sn", "-dn", "-threads", "0"])
+    cmd.extend(["-f", "s16le", "-ar", "16000", "-ac", "1", "-"])
+    proc = subprocess.run(cmd, check=True, capture_output=True)
+    return np.frombuffer(proc.stdout, dtype=np.int16).astype(np.float32) / 32768.0
 
 
 def main() -> int:
@@ -71,13 +78,15 @@ def main() -> int:
     if not Path(args.video).exists():
         raise SystemExit(f"Video not found: {args.video}")
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        audio_path = str(Path(tmpdir) / "clip.wav")
-        extract_audio(args.video, audio_path, args.start, args.end, args.slowdown)
-        import whisper
+    import whisper
+
+    # Load the model in the background while ffmpeg extracts the clip.
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        model_future = pool.submit(whisper.load_model, args.model)
+        audio = extract_audio(args.video, args.start, args.end, args.slowdown)
 
-        model = whisper.load_model(args.model)
-        result = model.transcribe(audio_path, language=args.language)
+        model = model_future.result()
+        result = model.transcribe(audio, language=args.language)
         transcript = result.get("text", "").strip()
         if args.output:
             Path(args.output).write_text(transcript + "\n", encoding="utf-8")
@@ -87,15 +96,27 @@ def main() -> int:
             tokenizer = whisper.tokenizer.get_tokenizer(
                 model.is_multilingual, language=args.language, task="transcribe"
             )
+            # Decode tokens straight from the underlying tiktoken encoding's byte
+            # table; timestamp tokens decode to "" just like tokenizer.decode.
+            encoding = getattr(tokenizer, "encoding", None)
             segments = []
             for seg in result.get("segments", []):
                 token_details = []
                 token_ids = seg.get("tokens") or []
-                for tid in token_ids:
+                if encoding is not None:
+                    texts = [
+                        encoding.decode_single_token_bytes(tid).decode("utf-8", errors="replace")
+                        if tid < tokenizer.timestamp_begin
+                        else ""
+                        for tid in token_ids
+                    ]
+                else:
+                    texts = [tokenizer.decode([tid]) for tid in token_ids]
+                for tid, text in zip(token_ids, texts):
                     token_details.append(
                         {
                             "id": tid,
-                            "text": tokenizer.decode([tid]),
+                            "text": text,
                             "confidence": seg.get("avg_logprob"),
                         }
                     )
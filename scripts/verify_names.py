@@ -19,12 +19,20 @@ Requirements:
 """
 
 import argparse
+import asyncio
+import contextlib
+import functools
+import hashlib
+import io
 import json
 import os
 import re
 import subprocess
 import sys
 import tempfile
+import threading
+import wave
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional, Tuple
@@ -36,6 +44,29 @@ try:
 except ImportError:
     pass  # dotenv not installed, rely on system env vars
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    from rapidfuzz import fuzz, process, utils
+    HAS_RAPIDFUZZ = True
+except ImportError:
+    HAS_RAPIDFUZZ = False
+
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
+_NUM_PREFIX = re.compile(r'^\d+[\.\)]\s*')  # "1. " / "2) " list numbering
+_JSON_DECODER = json.JSONDecoder()
+_WORD = re.compile(r"\w+", re.UNICODE)
+_WORD_ASCII = re.compile(r"\w+", re.ASCII)  # same matches on ASCII text, cheaper class test
+
 
 @dataclass
 class VerificationResult:
@@ -50,6 +81,7 @@ class VerificationResult:
     llm_reasoning: str
     errors: List[str] = field(default_factory=list)
     asr_result: Optional[Dict] = None
+    name_mappings: List[Dict] = field(default_factory=list)
 
 
 def parse_timestamp(ts: str) -> float:
@@ -66,10 +98,15 @@ def parse_timestamp(ts: str) -> float:
     return 0.0
 
 
-def extract_audio(video_path: str, output_path: str, 
+def extract_audio(video_path: str, output_path: Optional[str] = None,
                   start: Optional[str] = None, end: Optional[str] = None,
-                  slowdown: float = 1.0) -> str:
-    """Extract audio from video, optionally clipping to timestamps."""
+                  slowdown: float = 1.0, wav_bytes: bool = False):
+    """Extract audio from video, optionally clipping to timestamps.
+
+    Writes a 16 kHz mono WAV to output_path and returns the path. When no
+    output_path is given, ffmpeg's PCM output is read from stdout and returned
+    as a float32 numpy array, or as in-memory WAV file bytes if wav_bytes.
+    """
     cmd = ["ffmpeg", "-y", "-i", video_path]
     
     if start:
@@ -96,12 +133,141 @@ def extract_audio(video_path: str, output_path: str,
     if filters:
         cmd.extend(["-af", ",".join(filters)])
     
+    if output_path is None:
+        cmd.extend(["-f", "s16le", "-ar", "16000", "-ac", "1", "-"])
+        proc = subprocess.run(cmd, check=True, capture_output=True)
+        if wav_bytes:
+            # Write the header ourselves; ffmpeg cannot fix up sizes on a pipe
+            buf = io.BytesIO()
+            with wave.open(buf, "wb") as wav:
+                wav.setnchannels(1)
+                wav.setsampwidth(2)
+                wav.setframerate(16000)
+                wav.writeframes(proc.stdout)
+            return buf.getvalue()
+
+        import numpy as np
+
+        return np.frombuffer(proc.stdout, dtype=np.int16).astype(np.float32) / 32768.0
+
     cmd.extend(["-ar", "16000", "-ac", "1", output_path])
     
     subprocess.run(cmd, check=True, capture_output=True)
     return output_path
 
 
+# Quantized GGML checkpoints used for each --whisper-model size with whisper.cpp
+_WHISPER_CPP_MODELS = {
+    "tiny": "tiny-q5_1",
+    "base": "base-q5_1",
+    "small": "small-q5_1",
+    "medium": "medium-q5_0",
+    "large": "large-v3-q5_0",
+}
+
+
+@functools.lru_cache(maxsize=2)
+def _load_whisper_model(model_size: str, backend: str = "whisper",
+                        compute_type: str = "auto"):
+    """Load a Whisper model for the given backend, reusing recently loaded ones.
+
+    backend is "whisper" (openai-whisper), "faster-whisper" or "whisper-cpp".
+    For faster-whisper, compute_type "auto" picks int8_float16 on CUDA and
+    int8 on CPU. whisper.cpp downloads the quantized GGML model on first use.
+    """
+    if backend == "whisper-cpp":
+        try:
+            from pywhispercpp.model import Model
+        except ImportError:
+            raise RuntimeError("Install pywhispercpp: pip install pywhispercpp")
+        return Model(
+            _WHISPER_CPP_MODELS.get(model_size, model_size),
+            n_threads=os.cpu_count() or 4,
+            print_progress=False,
+            print_realtime=False,
+        )
+    if backend == "faster-whisper":
+        try:
+            import ctranslate2
+            from faster_whisper import WhisperModel
+        except ImportError:
+            raise RuntimeError("Install faster-whisper: pip install faster-whisper")
+        device = "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+        if compute_type == "auto":
+            compute_type = "int8_float16" if device == "cuda" else "int8"
+        return WhisperModel(model_size, device=device, compute_type=compute_type)
+
+    try:
+        import whisper
+    except ImportError:
+        raise RuntimeError("Install openai-whisper: pip install openai-whisper")
+    return whisper.load_model(model_size)
+
+
+def _transcribe_with_faster_whisper(model, audio, prompt: Optional[str],
+                                    language: Optional[str],
+                                    word_timestamps: bool,
+                                    batch_size: int) -> Tuple[str, Dict]:
+    """Transcribe with faster-whisper, decoding VAD-split chunks in batches.
+
+    A batch_size of 1 or less decodes sequentially with the VAD filter on.
+    Returns the transcript and a result dict shaped like openai-whisper's.
+    """
+    from faster_whisper import BatchedInferencePipeline
+
+    if batch_size > 1:
+        segments, info = BatchedInferencePipeline(model=model).transcribe(
+            audio,
+            batch_size=batch_size,
+            initial_prompt=prompt,
+            language=language,
+            word_timestamps=word_timestamps,
+        )
+    else:
+        segments, info = model.transcribe(
+            audio,
+            initial_prompt=prompt,
+            language=language,
+            word_timestamps=word_timestamps,
+            vad_filter=True,
+        )
+    result_segments = []
+    for seg in segments:
+        result_segments.append(
+            {
+                "start": seg.start,
+                "end": seg.end,
+                "text": seg.text,
+                "tokens": list(seg.tokens),
+                "avg_logprob": seg.avg_logprob,
+                "no_speech_prob": seg.no_speech_prob,
+                "compression_ratio": seg.compression_ratio,
+                "temperature": seg.temperature,
+                "words": [
+                    {"word": w.word, "start": w.start, "end": w.end, "probability": w.probability}
+                    for w in (seg.words or [])
+                ],
+            }
+        )
+    text = "".join(seg["text"] for seg in result_segments)
+    return text.strip(), {"text": text, "segments": result_segments, "language": info.language}
+
+
+def _transcribe_with_whisper_cpp(model, audio, prompt: Optional[str],
+                                 language: Optional[str]) -> Tuple[str, Dict]:
+    """Transcribe with whisper.cpp (CPU SIMD kernels, quantized weights)."""
+    params = {"language": language or "auto"}
+    if prompt:
+        params["initial_prompt"] = prompt
+    segments = [
+        # whisper.cpp reports times in 10 ms ticks
+        {"start": seg.t0 / 100.0, "end": seg.t1 / 100.0, "text": seg.text}
+        for seg in model.transcribe(audio, **params)
+    ]
+    text = " ".join(seg["text"].strip() for seg in segments)
+    return text, {"text": text, "segments": segments}
+
+
 def transcribe_audio(audio_path: str, model_size: str = "medium",
                      known_names: Optional[List[str]] = None,
                      use_gemini_asr: bool = True,
@@ -109,28 +275,34 @@ def transcribe_audio(audio_path: str, model_size: str = "medium",
                      word_timestamps: bool = False,
                      debug: bool = False,
                      prompt_output: Optional[str] = None,
-                     print_prompt: bool = False) -> Tuple[str, Optional[Dict]]:
+                     print_prompt: bool = False,
+                     model=None,
+                     backend: str = "whisper",
+                     batch_size: int = 16,
+                     compute_type: str = "auto") -> Tuple[str, Optional[Dict]]:
     """Transcribe audio using Whisper or Gemini.
     
     Args:
-        audio_path: Path to audio file
+        audio_path: Path to audio file; Whisper also accepts a 16 kHz float32 array
+            and Gemini WAV file bytes
         model_size: Whisper model size (if using Whisper)
         known_names: List of known player names to bias transcription
         use_gemini_asr: If True, use Gemini for ASR with player-name conditioning
+        model: Already-loaded Whisper model; loaded from model_size if omitted
+        backend: "whisper" (openai-whisper), "faster-whisper" (batched over VAD
+            chunks) or "whisper-cpp" (CPU-only, quantized GGML)
+        batch_size: Chunks decoded per forward pass (faster-whisper only)
+        compute_type: CTranslate2 quantization, "auto" for int8 (faster-whisper only)
     """
     
     if use_gemini_asr:
         return _transcribe_with_gemini(audio_path, known_names), None
     
     # Fall back to Whisper
-    try:
-        import whisper
-    except ImportError:
-        raise RuntimeError("Install openai-whisper: pip install openai-whisper")
-    
-    model = whisper.load_model(model_size)
+    if model is None:
+        model = _load_whisper_model(model_size, backend, compute_type)
     if debug:
-        print(f"[debug] whisper_model={model_size} language={language} word_timestamps={word_timestamps}")
+        print(f"[debug] whisper_model={model_size} backend={backend} language={language} word_timestamps={word_timestamps}")
     
     # Build prompt with known names to improve recognition
     prompt = None
@@ -151,6 +323,12 @@ def transcribe_audio(audio_path: str, model_size: str = "medium",
     if prompt and prompt_output:
         Path(prompt_output).write_text(prompt + "\n", encoding="utf-8")
     
+    if backend == "faster-whisper":
+        return _transcribe_with_faster_whisper(
+            model, audio_path, prompt, language, word_timestamps, batch_size
+        )
+    if backend == "whisper-cpp":
+        return _transcribe_with_whisper_cpp(model, audio_path, prompt, language)
     result = model.transcribe(
         audio_path,
         initial_prompt=prompt,
@@ -160,8 +338,16 @@ def transcribe_audio(audio_path: str, model_size: str = "medium",
     return result.get("text", "").strip(), result
 
 
-def _transcribe_with_gemini(audio_path: str, known_names: Optional[List[str]] = None) -> str:
-    """Transcribe audio using Gemini with player name conditioning.
+@functools.lru_cache(maxsize=4)
+def _gemini_client(api_key: str):
+    """Gemini client per API key, shared by transcription and verification."""
+    from google import genai
+
+    return genai.Client(api_key=api_key)
+
+
+def _transcribe_with_gemini(audio_path, known_names: Optional[List[str]] = None) -> str:
+    """Transcribe audio (a file path or WAV bytes) using Gemini with player name conditioning.
     
     This approach conditions the model to ONLY output recognized player names,
     not arbitrary text transcription.
@@ -175,7 +361,7 @@ def _transcribe_with_gemini(audio_path: str, known_names: Optional[List[str]] =
     api_key = os.getenv("GOOGLE_API_KEY")
     if not api_key:
         raise RuntimeError("Missing GOOGLE_API_KEY env var for Gemini.")
-    client = genai.Client(api_key=api_key)
+    client = _gemini_client(api_key)
     
     # Build a conditioning prompt with known names
     name_examples = ""
@@ -207,7 +393,20 @@ Kylian Mbappé
 ..."""
 
     # Upload the audio file and generate response
-    audio_file = client.files.upload(file=audio_path)
+    if isinstance(audio_path, (bytes, bytearray)):
+        try:
+            audio_file = client.files.upload(
+                file=io.BytesIO(audio_path), config={"mime_type": "audio/wav"}
+            )
+        except (TypeError, ValueError):
+            # Older SDKs only upload from a path; keep the file in RAM if possible
+            shm = "/dev/shm" if os.path.isdir("/dev/shm") else None
+            with tempfile.NamedTemporaryFile(suffix=".wav", dir=shm) as tmp:
+                tmp.write(audio_path)
+                tmp.flush()
+                audio_file = client.files.upload(file=tmp.name)
+    else:
+        audio_file = client.files.upload(file=audio_path)
     
     response = client.models.generate_content(
         model="gemini-2.0-flash",
@@ -223,12 +422,66 @@ Kylian Mbappé
     return response.text.strip()
 
 
+@functools.lru_cache(maxsize=4)
+def _known_name_automaton(keys: Tuple[str, ...]):
+    """Build an Aho-Corasick automaton over the match keys, once per key set.
+    
+    Each key maps to (position, key) so hits can be replayed in key order.
+    Only keys longer than 3 characters are added, as in the plain scan.
+    """
+    automaton = ahocorasick.Automaton()
+    for position, key in enumerate(keys):
+        if len(key) > 3:
+            automaton.add_word(key, (position, key))
+    if len(automaton):
+        automaton.make_automaton()
+    return automaton
+
+
+def _keys_in_transcript(keys: Iterable[str], transcript_lower: str) -> List[str]:
+    """Return keys (longer than 3 chars) found in the transcript, in key order."""
+    if HAS_AHOCORASICK:
+        automaton = _known_name_automaton(tuple(keys))
+        if not len(automaton):
+            return []
+        hits = {position: key for _, (position, key) in automaton.iter(transcript_lower)}
+        return [hits[position] for position in sorted(hits)]
+    return [key for key in keys if len(key) > 3 and key in transcript_lower]
+
+
+def _char_class(pred) -> str:
+    """Regex character class body for the BMP characters satisfying pred."""
+    ranges = []
+    start = None
+    for code in range(0x10000):
+        if pred(chr(code)):
+            if start is None:
+                start = code
+        elif start is not None:
+            ranges.append((start, code - 1))
+            start = None
+    return "".join(
+        re.escape(chr(a)) if a == b else f"{re.escape(chr(a))}-{re.escape(chr(b))}"
+        for a, b in ranges
+    )
+
+
+# A transcript token is a run of non-space, non-hyphen characters. It counts as
+# capitalized when its first character after stripping ,.?!;:() is uppercase.
+_UPPER = _char_class(str.isupper)
+_CAP_TOKEN = rf"[,.?!;:()]*[{_UPPER}][^\s\-]*"
+_CAP_RUN = re.compile(rf"(?<![^\s\-]){_CAP_TOKEN}(?:[\s\-]+{_CAP_TOKEN})*(?![^\s\-])")
+# Core of each token in a run, with surrounding ,.?!;:() stripped
+_CAP_WORD = re.compile(r"[,.?!;:()]*([^\s\-]+?)[,.?!;:()]*(?![^\s\-])")
+
+
 def extract_names_from_transcript(
     transcript: str,
     known_names: Optional[List[str]] = None,
     from_gemini_asr: bool = True,
     last_name_only: bool = False,
     player_db: Optional[Dict[str, Dict]] = None,
+    transcript_lower: Optional[str] = None,
 ) -> List[str]:
     """Extract footballer names from transcript.
     
@@ -236,6 +489,7 @@ def extract_names_from_transcript(
         transcript: The transcribed text
         known_names: List of known player names for matching
         from_gemini_asr: If True, transcript is already line-by-line names from Gemini
+        transcript_lower: transcript.lower(), if the caller already has it
     """
     names = []
     
@@ -245,7 +499,7 @@ def extract_names_from_transcript(
             name = line.strip().strip('-•*').strip()
             if name and len(name) > 2 and not name.startswith('#'):
                 # Clean up common artifacts
-                name = re.sub(r'^\d+[\.\)]\s*', '', name)  # Remove numbering
+                name = _NUM_PREFIX.sub('', name)  # Remove numbering
                 if name:
                     names.append(name)
         
@@ -274,66 +528,79 @@ def extract_names_from_transcript(
                 else:
                     known_lookup[last] = name
 
-    # Prefer the most famous entry for a last name if available
-    def pick_best(full_names: List[str]) -> str:
-        if not player_db:
-            return full_names[0]
+    # Prefer the most famous entry for a last name if available; each last
+    # name is resolved once however often it is matched
+    last_name_best: Dict[str, str] = {}
+
+    def pick_best(key: str) -> str:
+        cached = last_name_best.get(key)
+        if cached is not None:
+            return cached
+        full_names = last_name_map[key]
         best = None
-        best_score = -1.0
-        for full in full_names:
-            info = player_db.get(full.lower())
-            score = 0.0
-            if info:
-                score = float(info.get("fame_score") or 0.0)
-            if score > best_score:
-                best_score = score
-                best = full
-        return best or full_names[0]
+        if player_db:
+            best_score = -1.0
+            for full in full_names:
+                info = player_db.get(full.lower())
+                score = 0.0
+                if info:
+                    score = float(info.get("fame_score") or 0.0)
+                if score > best_score:
+                    best_score = score
+                    best = full
+        best = best or full_names[0]
+        last_name_best[key] = best
+        return best
     
     # First, try to match known names
-    transcript_lower = transcript.lower()
+    if transcript_lower is None:
+        transcript_lower = transcript.lower()
     if last_name_only and last_name_map:
-        for key, full_names in last_name_map.items():
-            if len(key) > 3 and key in transcript_lower:
-                display_name = pick_best(full_names)
-                if display_name not in names:
-                    names.append(display_name)
-    else:
-        for key, display_name in known_lookup.items():
-            if len(key) > 3 and key in transcript_lower:  # Avoid short matches
-                if display_name not in names:
-                    names.append(display_name)
+        for key in _keys_in_transcript(last_name_map, transcript_lower):
+            display_name = pick_best(key)
+            if display_name not in names:
+                names.append(display_name)
+    elif known_lookup:
+        # Keys of 3 characters or fewer are skipped to avoid short matches
+        for key in _keys_in_transcript(known_lookup, transcript_lower):
+            display_name = known_lookup[key]
+            if display_name not in names:
+                names.append(display_name)
     
+    # Last names in default_process form, built on the first fuzzy lookup
+    fuzzy_keys: Optional[List[str]] = None
+    fuzzy_choices: List[str] = []
+
     # Also extract capitalized word sequences as potential names
-    tokens = transcript.replace("-", " ").split()
-    buffer = []
-    
-    def flush():
-        if buffer:
-            candidate = " ".join(buffer).strip(",.?!;:")
-            if candidate and len(candidate) > 2:
-                if known_lookup or last_name_map:
-                    if last_name_only and last_name_map:
-                        key = candidate.split()[-1].lower()
-                        if key in last_name_map:
-                            match = pick_best(last_name_map[key])
-                            if match not in names:
-                                names.append(match)
-                    else:
-                        match = known_lookup.get(candidate.lower())
-                        if match and match not in names:
+    for run in _CAP_RUN.finditer(transcript):
+        candidate = " ".join(_CAP_WORD.findall(run.group()))
+        if len(candidate) > 2:
+            if known_lookup or last_name_map:
+                if last_name_only and last_name_map:
+                    key = candidate.split()[-1].lower()
+                    if key not in last_name_map and HAS_RAPIDFUZZ and len(key) > 3:
+                        # Catch ASR misspellings ("Ronaldho") of a known last name
+                        if fuzzy_keys is None:
+                            fuzzy_keys = list(last_name_map)
+                            fuzzy_choices = [utils.default_process(k) for k in fuzzy_keys]
+                        hit = process.extractOne(
+                            utils.default_process(key),
+                            fuzzy_choices,
+                            scorer=fuzz.ratio,
+                            score_cutoff=88,
+                        )
+                        if hit is not None:
+                            key = fuzzy_keys[hit[2]]
+                    if key in last_name_map:
+                        match = pick_best(key)
+                        if match not in names:
                             names.append(match)
-                elif candidate not in names:
-                    names.append(candidate)
-            buffer.clear()
-    
-    for token in tokens:
-        clean = token.strip(",.?!;:()")
-        if clean and clean[0].isupper():
-            buffer.append(clean)
-        else:
-            flush()
-    flush()
+                else:
+                    match = known_lookup.get(candidate.lower())
+                    if match and match not in names:
+                        names.append(match)
+            elif candidate not in names:
+                names.append(candidate)
     
     # Deduplicate while preserving order
     seen = set()
@@ -352,10 +619,11 @@ def build_name_mappings(
     names: List[str],
     player_db: Optional[Dict[str, Dict]] = None,
     last_name_only: bool = False,
+    transcript_lower: Optional[str] = None,
 ) -> List[Dict]:
     """Map extracted names back to transcript tokens and player info."""
     mappings = []
-    lower = transcript.lower()
+    lower = transcript.lower() if transcript_lower is None else transcript_lower
     for name in names:
         full = name
         last = name.split()[-1] if name.split() else name
@@ -385,25 +653,68 @@ def build_name_mappings(
     return mappings
 
 
+# Parsed JSONL rows and player DBs, keyed by path and reused until mtime/size change
+_JSONL_CACHE: Dict[str, Tuple[Tuple[float, int], List[Dict]]] = {}
+_PLAYER_DB_CACHE: Dict[str, Tuple[Tuple[float, int], Dict[str, Dict]]] = {}
+
+
+def _file_stamp(path: str) -> Tuple[float, int]:
+    st = os.stat(path)
+    return st.st_mtime, st.st_size
+
+
+def _read_jsonl(path: str) -> List[Dict]:
+    """Parse a JSONL file into dicts, skipping blank and malformed lines."""
+    stamp = _file_stamp(path)
+    cached = _JSONL_CACHE.get(str(path))
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    loads = orjson.loads if HAS_ORJSON else json.loads
+    lines = [line for line in Path(path).read_bytes().splitlines() if line.strip()]
+    # Parse the whole file as one JSON array; any malformed line makes this fail
+    # (or change the element count) and we fall back to skipping bad lines.
+    try:
+        objs = loads(b"[" + b",".join(lines) + b"]")
+    except ValueError:
+        objs = None
+    if objs is None or len(objs) != len(lines):
+        objs = []
+        for line in lines:
+            try:
+                objs.append(loads(line))
+            except ValueError:
+                if loads is json.loads:
+                    continue
+                # orjson rejects NaN/Infinity, which json accepts
+                try:
+                    objs.append(json.loads(line))
+                except ValueError:
+                    continue
+    rows = [obj for obj in objs if isinstance(obj, dict)]
+    _JSONL_CACHE[str(path)] = (stamp, rows)
+    return rows
+
+
 def load_player_database(db_path: str) -> Dict[str, Dict]:
-    """Load player database from JSONL file."""
+    """Load player database from JSONL file.
+
+    The result is cached per path until the file changes, so callers share
+    one dict and should treat it as read-only.
+    """
+    stamp = _file_stamp(db_path)
+    cached = _PLAYER_DB_CACHE.get(str(db_path))
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
     players = {}
-    with open(db_path, 'r', encoding='utf-8') as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                player = json.loads(line)
-                name = player.get('name', player.get('full_name', ''))
-                if name:
-                    players[name.lower()] = player
-                    # Also index by last name
-                    parts = name.split()
-                    if len(parts) > 1:
-                        players[parts[-1].lower()] = player
-            except json.JSONDecodeError:
-                continue
+    for player in _read_jsonl(db_path):
+        name = player.get('name', player.get('full_name', ''))
+        if name:
+            players[name.lower()] = player
+            # Also index by last name
+            parts = name.split()
+            if len(parts) > 1:
+                players[parts[-1].lower()] = player
+    _PLAYER_DB_CACHE[str(db_path)] = (stamp, players)
     return players
 
 
@@ -413,14 +724,7 @@ def _load_knowledge(path: str) -> List[Dict]:
         return []
     if p.suffix == ".jsonl":
         rows = []
-        for line in p.read_text(encoding="utf-8").splitlines():
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                obj = json.loads(line)
-            except json.JSONDecodeError:
-                continue
+        for obj in _read_jsonl(path):
             name = obj.get("name") or obj.get("full_name")
             if name:
                 obj = dict(obj)
@@ -465,18 +769,7 @@ def _extract_phrase(question: str, keyword: str) -> Optional[str]:
     return tail
 
 
-def _score_player(question: str, player: Dict) -> Tuple[int, float]:
-    q = question.lower()
-    score = 0
-    fame = float(player.get("fame_score") or 0.0)
-
-    # Normalize position string once for reuse.
-    position = str(player.get("position") or "").lower()
-
-    nationality = str(player.get("nationality") or "").lower()
-    if nationality and nationality in q:
-        score += 3
-
+def _player_clubs(player: Dict) -> List[str]:
     clubs = []
     for key in ("clubs", "club_history", "club", "current_club"):
         value = player.get(key)
@@ -488,44 +781,179 @@ def _score_player(question: str, player: Dict) -> Tuple[int, float]:
                 clubs.append(str(club).lower())
         elif isinstance(value, str):
             clubs.append(value.lower())
+    return clubs
 
-    club_phrase = _extract_phrase(q, "played for") or _extract_phrase(q, "play for")
-    if club_phrase:
-        if any(club_phrase in c for c in clubs):
-            score += 4
 
-    league = str(player.get("league") or "").lower()
-    leagues = [str(l).lower() for l in player.get("leagues", []) if l]
-    league_targets = []
+def _league_targets(q: str) -> List[str]:
     if "english premier league" in q or "premier league" in q:
-        league_targets.extend(["english premier league", "eng premier league", "premier league", "gb1"])
-    if league and (league in q or any(t in league for t in league_targets)):
-        score += 3
-    if any(l in q for l in leagues) or any(any(t in l for t in league_targets) for l in leagues):
-        score += 3
+        return ["english premier league", "eng premier league", "premier league", "gb1"]
+    return []
+
+
+# (question keywords, position tags, bonus) per outfield role; a question naming
+# the role rewards matching positions and penalizes any other known position.
+_POSITION_GROUPS = (
+    (("defender", "defence", "defense", "cb", "lb", "rb", "fullback", "full-back"),
+     ("def", "cb", "lb", "rb", "lwb", "rwb", "back"), 5),
+    (("midfielder", "midfield", "cm", "dm", "am"), ("mid", "cm", "dm", "am"), 3),
+    (("forward", "striker", "winger", "attack"), ("for", "wing", "att", "st"), 3),
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _position_query(q: str) -> Tuple[bool, Tuple[Tuple[Tuple[str, ...], int], ...]]:
+    """Question-side position checks, evaluated once per question."""
+    keeper = any(k in q for k in ("goalkeeper", "keeper"))
+    groups = tuple(
+        (tags, bonus) for keywords, tags, bonus in _POSITION_GROUPS
+        if any(k in q for k in keywords)
+    )
+    return keeper, groups
 
+
+def _position_score(q: str, position: str) -> int:
+    keeper, groups = _position_query(q)
+    score = 0
     if position and position in q:
         score += 1
-    if any(k in q for k in ["goalkeeper", "keeper"]):
-        if "goal" in position or position == "gk":
-            score += 2
-    if any(k in q for k in ["defender", "defence", "defense", "cb", "lb", "rb", "fullback", "full-back"]):
-        if any(k in position for k in ["def", "cb", "lb", "rb", "lwb", "rwb", "back"]):
-            score += 5
-        elif position:
-            score -= 1
-    if any(k in q for k in ["midfielder", "midfield", "cm", "dm", "am"]):
-        if any(k in position for k in ["mid", "cm", "dm", "am"]):
-            score += 3
-        elif position:
-            score -= 1
-    if any(k in q for k in ["forward", "striker", "winger", "attack"]):
-        if any(k in position for k in ["for", "wing", "att", "st"]):
-            score += 3
+    if keeper and ("goal" in position or position == "gk"):
+        score += 2
+    for tags, bonus in groups:
+        if any(k in position for k in tags):
+            score += bonus
         elif position:
             score -= 1
+    return score
+
 
-    return score, fame
+# Inverted indexes over knowledge files, keyed by (path, mtime, size)
+_KNOWLEDGE_INDEX_CACHE: Dict[Tuple[str, float, int], Dict] = {}
+
+
+def _build_knowledge_index(rows: List[Dict]) -> Dict:
+    """Group players by each attribute the prompt-name scoring looks at.
+
+    Scoring can then evaluate each distinct nationality/club/league/position
+    string against the question once, instead of once per player.
+    """
+    index: Dict = {
+        "names": [],
+        "sort_names": [],
+        "fame": [],
+        "by_nat": {},
+        "by_club": {},
+        "by_league": {},
+        "by_leagues": {},
+        "by_position": {},
+    }
+    for idx, player in enumerate(rows):
+        index["names"].append(player.get("name"))
+        index["sort_names"].append(str(player.get("name", "")).lower())
+        index["fame"].append(float(player.get("fame_score") or 0.0))
+        nationality = str(player.get("nationality") or "").lower()
+        index["by_nat"].setdefault(nationality, []).append(idx)
+        for club in set(_player_clubs(player)):
+            index["by_club"].setdefault(club, []).append(idx)
+        league = str(player.get("league") or "").lower()
+        index["by_league"].setdefault(league, []).append(idx)
+        for l in {str(l).lower() for l in player.get("leagues") or [] if l}:
+            index["by_leagues"].setdefault(l, []).append(idx)
+        position = str(player.get("position") or "").lower()
+        index["by_position"].setdefault(position, []).append(idx)
+    return index
+
+
+def _knowledge_index(knowledge_path: str) -> Dict:
+    st = os.stat(knowledge_path)
+    key = (str(knowledge_path), st.st_mtime, st.st_size)
+    index = _KNOWLEDGE_INDEX_CACHE.get(key)
+    if index is None:
+        index = _build_knowledge_index(_load_knowledge(knowledge_path))
+        _KNOWLEDGE_INDEX_CACHE.clear()
+        _KNOWLEDGE_INDEX_CACHE[key] = index
+    return index
+
+
+def _score_index(question: str, index: Dict) -> List[int]:
+    """Score every indexed player for a question.
+
+    Nationality +3, club from "played for"/"play for" +4, league +3 (primary
+    and secondary each), plus the position score.
+    """
+    q = question.lower()
+    scores = [0] * len(index["names"])
+
+    def add(indices: Iterable[int], delta: int) -> None:
+        for i in indices:
+            scores[i] += delta
+
+    for nationality, indices in index["by_nat"].items():
+        if nationality and nationality in q:
+            add(indices, 3)
+
+    club_phrase = _extract_phrase(q, "played for") or _extract_phrase(q, "play for")
+    if club_phrase:
+        matched = set()
+        for club, indices in index["by_club"].items():
+            if club_phrase in club:
+                matched.update(indices)
+        add(matched, 4)
+
+    league_targets = _league_targets(q)
+
+    def league_hit(league: str) -> bool:
+        return league in q or any(t in league for t in league_targets)
+
+    for league, indices in index["by_league"].items():
+        if league and league_hit(league):
+            add(indices, 3)
+    matched = set()
+    for league, indices in index["by_leagues"].items():
+        if league_hit(league):
+            matched.update(indices)
+    add(matched, 3)
+
+    for position, indices in index["by_position"].items():
+        delta = _position_score(q, position)
+        if delta:
+            add(indices, delta)
+    return scores
+
+
+# Ranked prompt names per (question, knowledge file version, limit, last-name mode)
+PROMPT_CACHE_DIR = Path(".cache") / "prompt_names"
+
+
+def _prompt_cache_file(question: str, knowledge_path: str, limit: int,
+                       last_names_only: bool) -> Path:
+    st = os.stat(knowledge_path)
+    raw = "||".join([
+        os.path.abspath(knowledge_path), str(st.st_mtime_ns), str(st.st_size),
+        question, str(limit), str(last_names_only),
+    ]).encode("utf-8")
+    return PROMPT_CACHE_DIR / f"{hashlib.blake2b(raw, digest_size=16).hexdigest()}.json"
+
+
+def _rank_prompt_names(question: str, knowledge_path: str, limit: int,
+                       last_names_only: bool) -> List[str]:
+    index = _knowledge_index(knowledge_path)
+    scores = _score_index(question, index)
+    fame = index["fame"]
+    sort_names = index["sort_names"]
+    order = sorted(
+        range(len(scores)),
+        key=lambda i: (scores[i], fame[i], sort_names[i]),
+        reverse=True,
+    )
+    all_names = index["names"]
+    filtered = [i for i in order if scores[i] > 0]
+    if filtered:
+        names = [all_names[i] for i in filtered if all_names[i]]
+    else:
+        names = [n for n in all_names if n]
+    if last_names_only:
+        names = [n.split()[-1] for n in names if n.split()]
+    return names[:limit]
 
 
 def _select_prompt_names(
@@ -536,20 +964,22 @@ def _select_prompt_names(
     last_names_only: bool,
 ) -> List[str]:
     if question and knowledge_path:
-        candidates = _load_knowledge(knowledge_path)
-        scored = []
-        for player in candidates:
-            score, fame = _score_player(question, player)
-            scored.append((score, fame, player))
-        scored.sort(key=lambda x: (x[0], x[1], str(x[2].get("name", "")).lower()), reverse=True)
-        filtered = [p for s, f, p in scored if s > 0]
-        if filtered:
-            names = [p.get("name") for p in filtered if p.get("name")]
-        else:
-            names = [p.get("name") for p in candidates if p.get("name")]
-        if last_names_only:
-            names = [n.split()[-1] for n in names if n.split()]
-        return names[:limit]
+        if not Path(knowledge_path).exists():
+            return []
+        cache_file = _prompt_cache_file(question, knowledge_path, limit, last_names_only)
+        try:
+            return json.loads(cache_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            pass
+        names = _rank_prompt_names(question, knowledge_path, limit, last_names_only)
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp = cache_file.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(names, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp, cache_file)
+        except OSError:
+            pass  # cache is best-effort
+        return names
 
     if player_db:
         names = [p.get("name", "") for p in player_db.values() if p.get("name")]
@@ -561,15 +991,63 @@ def _select_prompt_names(
     return []
 
 
+# Default model per verification provider
+_LLM_DEFAULT_MODELS = {
+    "gemini": "gemini-2.0-flash",
+    "openai": "gpt-4o-mini",
+    "ollama": "llama3.2",
+    "anthropic": "claude-3-5-sonnet-20241022",
+}
+
+
 def verify_with_llm(names: List[str], question: str, 
                     player_db: Optional[Dict[str, Dict]] = None,
                     llm_provider: str = "openai",
-                    model: str = None) -> Tuple[bool, List[str], str]:
+                    model: str = None,
+                    batch_size: int = 10) -> Tuple[bool, List[str], str]:
     """
     Use LLM to verify if names satisfy the question conditions.
+
+    More than batch_size names are split into sub-batches that are verified
+    concurrently, one request each, and the verdicts merged.
     Returns: (all_valid, invalid_names, reasoning)
     """
-    
+    if llm_provider not in _LLM_DEFAULT_MODELS:
+        raise ValueError(f"Unknown LLM provider: {llm_provider}")
+    model = model or _LLM_DEFAULT_MODELS[llm_provider]
+
+    if len(names) <= batch_size:
+        return _verify_prompt(_build_verification_prompt(names, question, player_db), llm_provider, model)
+
+    chunks = [names[i:i + batch_size] for i in range(0, len(names), batch_size)]
+    with ThreadPoolExecutor(max_workers=len(chunks)) as pool:
+        results = list(pool.map(
+            lambda chunk: _verify_prompt(
+                _build_verification_prompt(chunk, question, player_db), llm_provider, model
+            ),
+            chunks,
+        ))
+    all_valid = all(r[0] for r in results)
+    invalid_names = [name for r in results for name in r[1]]
+    reasoning = "\n".join(r[2] for r in results)
+    return all_valid, invalid_names, reasoning
+
+
+def _verify_prompt(prompt: str, llm_provider: str, model: str) -> Tuple[bool, List[str], str]:
+    if llm_provider == "gemini":
+        return _verify_with_gemini(prompt, model)
+    elif llm_provider == "openai":
+        return _verify_with_openai(prompt, model)
+    elif llm_provider == "ollama":
+        return _verify_with_ollama(prompt, model)
+    elif llm_provider == "anthropic":
+        return _verify_with_anthropic(prompt, model)
+    else:
+        raise ValueError(f"Unknown LLM provider: {llm_provider}")
+
+
+def _build_verification_prompt(names: List[str], question: str,
+                               player_db: Optional[Dict[str, Dict]] = None) -> str:
     # Build context about players from database
     player_info = []
     for name in names:
@@ -589,13 +1067,14 @@ def verify_with_llm(names: List[str], question: str,
             player_info.append(f"- {name}: (no database info available)")
     
     player_context = "\n".join(player_info) if player_info else "No player information available."
+    name_lines = "- " + "\n- ".join(names) if names else ""
     
     prompt = f"""You are a football/soccer expert. A user was asked this trivia question:
 
 QUESTION: {question}
 
 They named these players:
-{chr(10).join(f'- {name}' for name in names)}
+{name_lines}
 
 Player information from database:
 {player_context}
@@ -615,17 +1094,7 @@ Respond in this exact JSON format:
 }}
 
 Only output the JSON, nothing else."""
-
-    if llm_provider == "gemini":
-        return _verify_with_gemini(prompt, model or "gemini-2.0-flash")
-    elif llm_provider == "openai":
-        return _verify_with_openai(prompt, model or "gpt-4o-mini")
-    elif llm_provider == "ollama":
-        return _verify_with_ollama(prompt, model or "llama3.2")
-    elif llm_provider == "anthropic":
-        return _verify_with_anthropic(prompt, model or "claude-3-5-sonnet-20241022")
-    else:
-        raise ValueError(f"Unknown LLM provider: {llm_provider}")
+    return prompt
 
 
 def _verify_with_gemini(prompt: str, model: str) -> Tuple[bool, List[str], str]:
@@ -639,7 +1108,7 @@ def _verify_with_gemini(prompt: str, model: str) -> Tuple[bool, List[str], str]:
     api_key = os.getenv("GOOGLE_API_KEY")
     if not api_key:
         raise RuntimeError("Missing GOOGLE_API_KEY env var for Gemini.")
-    client = genai.Client(api_key=api_key)
+    client = _gemini_client(api_key)
     
     response = client.models.generate_content(
         model=model,
@@ -709,11 +1178,16 @@ def _parse_llm_response(text: str) -> Tuple[bool, List[str], str]:
     """Parse LLM JSON response."""
     # Try to extract JSON from response
     try:
-        # Find JSON in response
-        json_match = re.search(r'\{[^{}]*\}', text, re.DOTALL)
-        if json_match:
-            data = json.loads(json_match.group())
-        else:
+        # Decode the first complete JSON object in the response, nested or not
+        data = None
+        start = text.find('{')
+        while start != -1:
+            try:
+                data, _ = _JSON_DECODER.raw_decode(text, start)
+                break
+            except json.JSONDecodeError:
+                start = text.find('{', start + 1)
+        if data is None:
             data = json.loads(text)
         
         all_valid = data.get('all_valid', False)
@@ -725,6 +1199,28 @@ def _parse_llm_response(text: str) -> Tuple[bool, List[str], str]:
         return False, [], f"Failed to parse LLM response: {text[:500]}"
 
 
+# Local Whisper backends load and decode one clip at a time; concurrent
+# pipelines (run_pipeline_async) still overlap ffmpeg, Gemini and LLM calls.
+_LOCAL_ASR_LOCK = threading.Lock()
+
+
+def _load_local_asr_model(model_size: str, backend: str, compute_type: str):
+    with _LOCAL_ASR_LOCK:
+        return _load_whisper_model(model_size, backend, compute_type)
+
+
+async def run_pipeline_async(video_path: str, question: str, **kwargs) -> VerificationResult:
+    """run_pipeline in a worker thread, so several videos can run concurrently."""
+    return await asyncio.to_thread(run_pipeline, video_path, question, **kwargs)
+
+
+async def run_pipelines(video_paths: List[str], question: str, **kwargs) -> List[VerificationResult]:
+    """Verify several videos concurrently; results are in video_paths order."""
+    return list(await asyncio.gather(
+        *(run_pipeline_async(video_path, question, **kwargs) for video_path in video_paths)
+    ))
+
+
 def run_pipeline(video_path: str, question: str,
                  start: Optional[str] = None,
                  end: Optional[str] = None,
@@ -744,7 +1240,10 @@ def run_pipeline(video_path: str, question: str,
                  question_filter: bool = False,
                  knowledge_path: Optional[str] = None,
                  prompt_limit: int = 1000,
-                 prompt_last_names: bool = False) -> VerificationResult:
+                 prompt_last_names: bool = False,
+                 asr_backend: str = "whisper",
+                 batch_size: int = 16,
+                 compute_type: str = "auto") -> VerificationResult:
     """Run the full verification pipeline."""
     
     errors = []
@@ -769,44 +1268,54 @@ def run_pipeline(video_path: str, question: str,
     if debug:
         print(f"[debug] prompt_db_path={prompt_db_path}")
     
+    # Load the Whisper model in the background while ffmpeg extracts the clip
+    preload = None
+    model_future = None
+    if not use_gemini_asr:
+        preload = ThreadPoolExecutor(max_workers=1)
+        model_future = preload.submit(_load_local_asr_model, whisper_model, asr_backend, compute_type)
+
     # Extract audio from video
     print(f"Extracting audio from {video_path}...")
     if debug:
         print(f"[debug] start={start} end={end} slowdown={slowdown}")
-    with tempfile.TemporaryDirectory() as tmpdir:
-        audio_path = str(Path(tmpdir) / "audio.wav")
-        asr_result = None
-        try:
-            extract_audio(video_path, audio_path, start, end, slowdown)
-        except subprocess.CalledProcessError as e:
-            errors.append(f"Failed to extract audio: {e}")
-            return VerificationResult(
-                video_path=video_path, question=question,
-                transcript="", extracted_names=[], verified_names=[],
-                all_valid=False, invalid_names=[], llm_reasoning="",
-                errors=errors
+    # Gemini uploads WAV bytes; Whisper takes the PCM samples straight from ffmpeg
+    asr_result = None
+    try:
+        audio = extract_audio(video_path, None, start, end, slowdown, wav_bytes=use_gemini_asr)
+    except subprocess.CalledProcessError as e:
+        if preload is not None:
+            preload.shutdown(wait=False)
+        errors.append(f"Failed to extract audio: {e}")
+        return VerificationResult(
+            video_path=video_path, question=question,
+            transcript="", extracted_names=[], verified_names=[],
+            all_valid=False, invalid_names=[], llm_reasoning="",
+            errors=errors
+        )
+    
+    # Transcribe audio
+    asr_method = "Gemini" if use_gemini_asr else f"{asr_backend} ({whisper_model})"
+    print(f"Transcribing audio with {asr_method}...")
+    try:
+        prompt_names = known_names
+        if prompt_db:
+            prompt_names = list(set(p.get("name", "") for p in prompt_db.values() if p.get("name")))
+        if use_gemini_asr is False and (question and question_filter):
+            prompt_names = _select_prompt_names(
+                question,
+                knowledge_path,
+                prompt_db or player_db,
+                prompt_limit,
+                prompt_last_names,
             )
-        
-        # Transcribe audio
-        asr_method = "Gemini" if use_gemini_asr else f"Whisper ({whisper_model})"
-        print(f"Transcribing audio with {asr_method}...")
-        try:
-            prompt_names = known_names
-            if prompt_db:
-                prompt_names = list(set(p.get("name", "") for p in prompt_db.values() if p.get("name")))
-            if use_gemini_asr is False and (question and question_filter):
-                prompt_names = _select_prompt_names(
-                    question,
-                    knowledge_path,
-                    prompt_db or player_db,
-                    prompt_limit,
-                    prompt_last_names,
-                )
-            if debug and use_gemini_asr is False:
-                print(f"[debug] question_filter={question_filter} prompt_limit={prompt_limit} prompt_last_names={prompt_last_names}")
-                print(f"[debug] prompt_names_count={len(prompt_names or [])}")
+        if debug and use_gemini_asr is False:
+            print(f"[debug] question_filter={question_filter} prompt_limit={prompt_limit} prompt_last_names={prompt_last_names}")
+            print(f"[debug] prompt_names_count={len(prompt_names or [])}")
+        model = model_future.result() if model_future is not None else None
+        with contextlib.nullcontext() if use_gemini_asr else _LOCAL_ASR_LOCK:
             transcript, asr_result = transcribe_audio(
-                audio_path,
+                audio,
                 whisper_model,
                 prompt_names,
                 use_gemini_asr,
@@ -815,25 +1324,34 @@ def run_pipeline(video_path: str, question: str,
                 debug=debug,
                 prompt_output=prompt_output,
                 print_prompt=print_prompt,
+                model=model,
+                backend=asr_backend,
+                batch_size=batch_size,
+                compute_type=compute_type,
             )
-            print(f"  Transcript: {transcript[:200]}...")
-        except Exception as e:
-            errors.append(f"Transcription failed: {e}")
-            return VerificationResult(
-                video_path=video_path, question=question,
-                transcript="", extracted_names=[], verified_names=[],
-                all_valid=False, invalid_names=[], llm_reasoning="",
-                errors=errors
-            )
+        print(f"  Transcript: {transcript[:200]}...")
+    except Exception as e:
+        errors.append(f"Transcription failed: {e}")
+        return VerificationResult(
+            video_path=video_path, question=question,
+            transcript="", extracted_names=[], verified_names=[],
+            all_valid=False, invalid_names=[], llm_reasoning="",
+            errors=errors
+        )
+    finally:
+        if preload is not None:
+            preload.shutdown(wait=False)
     
     # Extract names
     print("Extracting player names...")
+    transcript_lower = transcript.lower()
     names = extract_names_from_transcript(
         transcript,
         known_names,
         from_gemini_asr=use_gemini_asr,
         last_name_only=last_name_only,
         player_db=player_db,
+        transcript_lower=transcript_lower,
     )
     print(f"  Found {len(names)} names: {names}")
     
@@ -861,11 +1379,12 @@ def run_pipeline(video_path: str, question: str,
     
     # Build verified names info
     verified_names = []
+    invalid_set = set(invalid_names)
     for name in names:
         info = player_db.get(name.lower()) if player_db else {}
         verified_names.append({
             "name": name,
-            "valid": name not in invalid_names,
+            "valid": name not in invalid_set,
             "info": {
                 "nationality": info.get('nationality', 'Unknown'),
                 "club": info.get('club', 'Unknown'),
@@ -883,15 +1402,89 @@ def run_pipeline(video_path: str, question: str,
         invalid_names=invalid_names,
         llm_reasoning=reasoning,
         errors=errors,
-        asr_result=asr_result
+        asr_result=asr_result,
+        name_mappings=build_name_mappings(
+            transcript,
+            names,
+            player_db=player_db,
+            last_name_only=last_name_only,
+            transcript_lower=transcript_lower,
+        ),
     )
 
 
+def _json_bytes(obj) -> bytes:
+    """Indented UTF-8 JSON, encoded with orjson when available."""
+    if HAS_ORJSON:
+        options = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        return orjson.dumps(obj, option=options)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _json_line(obj) -> bytes:
+    """Compact UTF-8 JSON, encoded with orjson when available."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+def _result_output(result: VerificationResult) -> Dict:
+    return {
+        "video": result.video_path,
+        "question": result.question,
+        "transcript": result.transcript,
+        "names_found": result.extracted_names,
+        "names_count": len(result.extracted_names),
+        "all_valid": result.all_valid,
+        "invalid_names": result.invalid_names,
+        "reasoning": result.llm_reasoning,
+        "verified_names": result.verified_names,
+        "name_mappings": result.name_mappings,
+        "errors": result.errors,
+    }
+
+
+def _print_result(result: VerificationResult) -> None:
+    buf = io.StringIO()
+    buf.write("\n" + "="*60 + "\n")
+    buf.write("VERIFICATION RESULT\n")
+    buf.write("="*60 + "\n")
+    buf.write(f"Question: {result.question}\n")
+    buf.write(f"Names found ({len(result.extracted_names)}): {', '.join(result.extracted_names)}\n")
+    buf.write(f"All valid: {'✅ YES' if result.all_valid else '❌ NO'}\n")
+    if result.invalid_names:
+        buf.write(f"Invalid names: {', '.join(result.invalid_names)}\n")
+    buf.write(f"Reasoning: {result.llm_reasoning}\n")
+    
+    if result.errors:
+        buf.write(f"\nErrors: {result.errors}\n")
+    sys.stdout.write(buf.getvalue())
+
+
+def _report_many(results: List[VerificationResult], args: argparse.Namespace) -> int:
+    """Print and save the results of a multi-video run (a JSON list, one entry per video)."""
+    outputs = []
+    for result in results:
+        print(f"\nVideo: {result.video_path}")
+        _print_result(result)
+        outputs.append(_result_output(result))
+
+    if args.output:
+        Path(args.output).write_bytes(_json_bytes(outputs))
+        print(f"\nFull results saved to {args.output}")
+    elif args.json_stdout:
+        print("\nFull JSON output:")
+        print(_json_bytes(outputs).decode("utf-8"))
+    
+    return 0 if all(result.all_valid for result in results) else 1
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Verify footballer names from video against a trivia question"
     )
-    parser.add_argument("video", help="Path to video file")
+    parser.add_argument("video", nargs="+",
+                       help="Path to video file (several videos are verified concurrently)")
     parser.add_argument("question", help="Trivia question to verify against")
     parser.add_argument("--start", "-s", help="Start timestamp (e.g., '0:30' or '30')")
     parser.add_argument("--end", "-e", help="End timestamp (e.g., '1:00' or '60')")
@@ -915,8 +1508,13 @@ def main():
                        help="LLM provider (default: gemini)")
     parser.add_argument("--llm-model", "-m", 
                        help="Specific LLM model to use (default: provider's default)")
-    parser.add_argument("--asr", default="whisper", choices=["whisper", "gemini"],
+    parser.add_argument("--asr", default="whisper", choices=["whisper", "faster-whisper", "whisper-cpp", "gemini"],
                        help="ASR provider (default: whisper)")
+    parser.add_argument("--batch-size", type=int, default=16,
+                       help="Audio chunks per batched decode (faster-whisper only, default: 16)")
+    parser.add_argument("--compute-type", default="auto",
+                       help="CTranslate2 compute type, e.g. int8, int8_float16, float16 "
+                            "(faster-whisper only, default: int8 on CPU, int8_float16 on GPU)")
     parser.add_argument("--transcript-output", help="Write raw transcript to a text file")
     parser.add_argument("--mapping-output", help="Write transcript-to-name mapping JSON")
     parser.add_argument("--tokens-output", help="Write transcript tokens to a text file")
@@ -933,16 +1531,19 @@ def main():
     parser.add_argument("--output", "-o", help="Output JSON file (optional)")
     
     args = parser.parse_args()
+    if len(args.video) > 1 and any([args.transcript_output, args.mapping_output, args.tokens_output,
+                                    args.probs_output, args.prompt_output]):
+        parser.error("per-video output files (--transcript-output, --mapping-output, "
+                     "--tokens-output, --probs-output, --prompt-output) need a single video")
     
-    # Check video exists
-    if not Path(args.video).exists():
-        print(f"Error: Video file not found: {args.video}")
-        return 1
+    # Check videos exist
+    for video in args.video:
+        if not Path(video).exists():
+            print(f"Error: Video file not found: {video}")
+            return 1
     
     # Run pipeline
-    result = run_pipeline(
-        video_path=args.video,
-        question=args.question,
+    pipeline_kwargs = dict(
         start=args.start,
         end=args.end,
         slowdown=args.slowdown,
@@ -962,7 +1563,15 @@ def main():
         knowledge_path=args.knowledge,
         prompt_limit=args.prompt_limit,
         prompt_last_names=args.prompt_last_names,
+        asr_backend="whisper" if args.asr == "gemini" else args.asr,
+        batch_size=args.batch_size,
+        compute_type=args.compute_type,
     )
+    if len(args.video) > 1:
+        return _report_many(
+            asyncio.run(run_pipelines(args.video, args.question, **pipeline_kwargs)), args
+        )
+    result = run_pipeline(args.video[0], args.question, **pipeline_kwargs)
 
     if args.transcript_output:
         Path(args.transcript_output).write_text(
@@ -970,50 +1579,22 @@ def main():
         )
     
     # Output results
-    name_mappings = build_name_mappings(
-        result.transcript,
-        result.extracted_names,
-        player_db=load_player_database(args.player_db) if args.player_db else None,
-        last_name_only=args.last_name_only,
-    )
-
-    output = {
-        "video": result.video_path,
-        "question": result.question,
-        "transcript": result.transcript,
-        "names_found": result.extracted_names,
-        "names_count": len(result.extracted_names),
-        "all_valid": result.all_valid,
-        "invalid_names": result.invalid_names,
-        "reasoning": result.llm_reasoning,
-        "verified_names": result.verified_names,
-        "name_mappings": name_mappings,
-        "errors": result.errors,
-    }
-    
-    print("\n" + "="*60)
-    print("VERIFICATION RESULT")
-    print("="*60)
-    print(f"Question: {result.question}")
-    print(f"Names found ({len(result.extracted_names)}): {', '.join(result.extracted_names)}")
-    print(f"All valid: {'✅ YES' if result.all_valid else '❌ NO'}")
-    if result.invalid_names:
-        print(f"Invalid names: {', '.join(result.invalid_names)}")
-    print(f"Reasoning: {result.llm_reasoning}")
-    
-    if result.errors:
-        print(f"\nErrors: {result.errors}")
+    output = _result_output(result)
+    _print_result(result)
     
     if args.tokens_output:
-        tokens = re.findall(r"\w+", result.transcript, flags=re.UNICODE)
+        word = _WORD_ASCII if result.transcript.isascii() else _WORD
+        tokens = word.findall(result.transcript)
         Path(args.tokens_output).write_text("\n".join(tokens) + "\n", encoding="utf-8")
 
     if args.probs_output:
         if result.asr_result:
-            segments = []
-            for seg in result.asr_result.get("segments", []):
-                segments.append(
-                    {
+            # One segment per line, written as it is serialized
+            with open(args.probs_output, "wb") as f:
+                f.write(b'{"segments": [')
+                for i, seg in enumerate(result.asr_result.get("segments", [])):
+                    f.write(b"\n" if i == 0 else b",\n")
+                    f.write(_json_line({
                         "start": seg.get("start"),
                         "end": seg.get("end"),
                         "text": seg.get("text"),
@@ -1022,36 +1603,27 @@ def main():
                         "compression_ratio": seg.get("compression_ratio"),
                         "temperature": seg.get("temperature"),
                         "words": seg.get("words", []),
-                    }
-                )
-            Path(args.probs_output).write_text(
-                json.dumps({"segments": segments}, ensure_ascii=True, indent=2) + "\n",
-                encoding="utf-8",
-            )
+                    }))
+                f.write(b"\n]}\n")
         else:
-            Path(args.probs_output).write_text(
-                json.dumps(
+            Path(args.probs_output).write_bytes(
+                _json_bytes(
                     {
                         "error": "No ASR result available (Gemini ASR does not expose token probabilities)."
-                    },
-                    ensure_ascii=True,
-                    indent=2,
+                    }
                 )
-                + "\n",
-                encoding="utf-8",
+                + b"\n"
             )
 
     if args.output:
-        with open(args.output, 'w', encoding='utf-8') as f:
-            json.dump(output, f, indent=2, ensure_ascii=False)
+        Path(args.output).write_bytes(_json_bytes(output))
         print(f"\nFull results saved to {args.output}")
     elif args.json_stdout:
         print("\nFull JSON output:")
-        print(json.dumps(output, indent=2, ensure_ascii=False))
+        print(_json_bytes(output).decode("utf-8"))
 
     if args.mapping_output:
-        with open(args.mapping_output, "w", encoding="utf-8") as f:
-            json.dump(name_mappings, f, indent=2, ensure_ascii=False)
+        Path(args.mapping_output).write_bytes(_json_bytes(result.name_mappings))
         print(f"\nName mapping saved to {args.mapping_output}")
     
     return 0 if result.all_valid else 1
@@ -6,33 +6,66 @@ import math
 import shutil
 import subprocess
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional, Union
+
+if TYPE_CHECKING:
+    import numpy as np
 
 
 def _build_atempo_chain(speed: float) -> str:
     if speed <= 0:
         raise ValueError("Speed must be positive.")
 
-    # ffmpeg atempo supports 0.5 to 2.0 per filter; chain if needed.
-    filters = []
-    remaining = speed
-    while remaining < 0.5:
-        filters.append(0.5)
-        remaining /= 0.5
-    while remaining > 2.0:
-        filters.append(2.0)
-        remaining /= 2.0
-    filters.append(remaining)
+    # ffmpeg atempo supports 0.5 to 2.0 per filter; chain the fewest saturated
+    # stages that bring the remainder into range.
+    if speed < 0.5:
+        step = 0.5
+        count = math.ceil(math.log2(0.5 / speed))
+    elif speed > 2.0:
+        step = 2.0
+        count = math.ceil(math.log2(speed / 2.0))
+    else:
+        step, count = 1.0, 0
+    filters = [step] * count + [speed / step**count]
     return ",".join(f"atempo={f:.3f}" for f in filters)
 
 
-def maybe_speed_adjust(audio_path: str, speed: Optional[float], workdir: Path) -> str:
+def maybe_speed_adjust(
+    audio_path: str, speed: Optional[float], workdir: Optional[Path] = None
+) -> Union[str, "np.ndarray"]:
+    """Return audio_path, or a speed-adjusted version of it.
+
+    With a workdir the adjusted audio is written there as WAV and its path is
+    returned; without one ffmpeg streams 16 kHz mono PCM on stdout and the
+    samples come back as a float32 array, which the Whisper backends accept
+    in place of a path.
+    """
     if speed is None or math.isclose(speed, 1.0, rel_tol=1e-4):
         return audio_path
 
     if not shutil.which("ffmpeg"):
         raise RuntimeError("ffmpeg not found; cannot adjust audio speed.")
 
+    if workdir is None:
+        import numpy as np
+
+        cmd = [
+            "ffmpeg",
+            "-i",
+            audio_path,
+            "-filter:a",
+            _build_atempo_chain(speed),
+            "-f",
+            "s16le",
+            "-ac",
+            "1",
+            "-ar",
+            "16000",
+            "-",
+        ]
+        proc = subprocess.run(cmd, check=True, capture_output=True)
+        return np.frombuffer(proc.stdout, dtype=np.int16).astype(np.float32) / 32768.0
+
     workdir.mkdir(parents=True, exist_ok=True)
     output_path = workdir / (Path(audio_path).stem + f"_speed{speed:.2f}.wav")
     filter_chain = _build_atempo_chain(speed)
@@ -6,11 +6,11 @@ import argparse
 import json
 from pathlib import Path
 
-from asr import WhisperTranscriber, build_prompt_from_names
+from asr import FasterWhisperTranscriber, WhisperTranscriber, build_prompt_from_names
 from audio import maybe_speed_adjust
 from eval import LLMConditionChecker, RuleBasedConditionChecker
 from knowledge import KnowledgeBase
-from llm import NullLLMClient
+from llm import CachingGeminiClient, NullLLMClient
 from names import DictionaryNameExtractor
 from pipeline import Pipeline
 
@@ -25,12 +25,34 @@ def main() -> int:
         help="Path to player knowledge JSON/JSONL",
     )
     parser.add_argument("--model", default="small", help="Whisper model size")
+    parser.add_argument(
+        "--asr",
+        choices=("whisper", "faster-whisper"),
+        default="whisper",
+        help="ASR backend (faster-whisper runs int8 CTranslate2 models)",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=16,
+        help="VAD chunks decoded per batch (faster-whisper only; 1 disables batching)",
+    )
     parser.add_argument(
         "--checker",
         choices=("rule", "llm"),
         default="rule",
         help="Condition checker mode",
     )
+    parser.add_argument(
+        "--llm",
+        choices=("none", "gemini"),
+        default="none",
+        help="LLM client for --checker llm (Gemini responses are cached in .cache/llm)",
+    )
+    parser.add_argument(
+        "--llm-context",
+        help="Static context file (e.g. the knowledge JSON) sent once as Gemini cached content",
+    )
     parser.add_argument(
         "--slowdown",
         type=float,
@@ -53,22 +75,38 @@ def main() -> int:
     known_names = knowledge.all_names()
 
     prompt = build_prompt_from_names(known_names) if args.bias_names else None
-    transcriber = WhisperTranscriber(model_size=args.model, prompt=prompt)
+    if args.asr == "faster-whisper":
+        transcriber = FasterWhisperTranscriber(
+            model_size=args.model,
+            prompt=prompt,
+            batch_size=args.batch_size,
+        )
+    else:
+        transcriber = WhisperTranscriber(model_size=args.model, prompt=prompt)
 
     extractor = DictionaryNameExtractor(
         known_names=known_names,
         allow_last_name_only=args.allow_last_name,
+        prebuilt_index=knowledge.name_indexes(),
     )
 
     if args.checker == "llm":
-        checker = LLMConditionChecker(knowledge=knowledge, llm=NullLLMClient())
+        if args.llm == "gemini":
+            context = (
+                Path(args.llm_context).read_text(encoding="utf-8") if args.llm_context else None
+            )
+            llm = CachingGeminiClient(context=context)
+        else:
+            llm = NullLLMClient()
+        checker = LLMConditionChecker(knowledge=knowledge, llm=llm)
     else:
         checker = RuleBasedConditionChecker(knowledge=knowledge)
 
     pipeline = Pipeline(transcriber=transcriber, extractor=extractor, checker=checker)
 
-    audio_path = maybe_speed_adjust(args.audio, args.slowdown, Path(".cache/audio"))
-    result = pipeline.run(audio_path, args.question)
+    # Speed-adjusted audio stays in memory; the transcribers accept arrays.
+    audio = maybe_speed_adjust(args.audio, args.slowdown)
+    result = pipeline.run(audio, args.question)
 
     payload = {
         "transcript": result.transcript,
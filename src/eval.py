@@ -3,15 +3,30 @@
 from __future__ import annotations
 
 import json
+import re
 from typing import Iterable, List, Sequence, Tuple
 
 from knowledge import KnowledgeBase
 from llm import LLMClient
 
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover - optional speedup
+    _loads = json.loads
+
 
 class RuleBasedConditionChecker:
     """Rule-based condition checker using a local knowledge base."""
 
+    # Question intents, matched in one scan; earlier intents win when several match.
+    _INTENT_RE = re.compile(
+        r"(?P<world_cup>world cup)|(?P<treble>treble)"
+        r"|(?P<club>played for|club)|(?P<nationality>national|are)"
+    )
+    _INTENT_ORDER = ("world_cup", "treble", "club", "nationality")
+
     def __init__(self, knowledge: KnowledgeBase) -> None:
         self.knowledge = knowledge
 
@@ -23,85 +38,76 @@ class RuleBasedConditionChecker:
         if "all" not in q:
             return False, "Question must include an 'all' constraint."
 
-        if "world cup" in q:
-            for name in names:
-                player = self.knowledge.get(name)
-                if not player:
-                    return False, f"Missing knowledge for {name}."
-                if not player.world_cup_years:
-                    return False, f"{name} never played in a World Cup."
-            return True, "All players have World Cup appearances."
-
-        if "treble" in q:
-            club = None
-            if "with" in q:
-                club = q.split("with", 1)[1].strip("?.! ")
-            for name in names:
-                player = self.knowledge.get(name)
-                if not player:
-                    return False, f"Missing knowledge for {name}."
-                matching = [
-                    entry
-                    for entry in player.honors
-                    if entry.get("type") == "treble"
-                    and (not club or entry.get("club", "").lower() == club.lower())
-                ]
-                if not matching:
-                    if club:
-                        return False, f"{name} did not win a treble with {club}."
-                    return False, f"{name} did not win a treble."
-            details = []
-            for name in names:
-                player = self.knowledge.get(name)
-                for entry in player.honors:
-                    if entry.get("type") == "treble":
-                        if not club or entry.get("club", "").lower() == club.lower():
-                            year = entry.get("season")
-                            details.append(f"{name}: {year}")
-                            break
-            if club:
-                return True, f"All players won a treble with {club}. " + "; ".join(details)
-            return True, "All players won a treble. " + "; ".join(details)
-
-        if "played for" in q or "club" in q:
-            if "played for" in q:
-                club = q.split("played for", 1)[1].strip()
-            else:
-                club = q.split("club", 1)[1].strip()
-            club = club.strip("?.! ")
-            details: List[str] = []
-            for name in names:
-                player = self.knowledge.get(name)
-                if not player:
-                    return False, f"Missing knowledge for {name}."
-                clubs = [c.lower() for c in player.clubs]
-                if club and club.lower() not in clubs:
-                    return False, f"{name} did not play for {club}."
-                if player.club_history:
-                    for entry in player.club_history:
-                        if entry.get("club", "").lower() == club.lower():
-                            start = entry.get("from")
-                            end = entry.get("to")
-                            details.append(f"{name}: {start} to {end}")
-                            break
-            if details:
-                return True, f"All players played for {club}. " + "; ".join(details)
-            return True, f"All players played for {club}."
-
-        if "national" in q or "are" in q:
-            for name in names:
-                player = self.knowledge.get(name)
-                if not player:
-                    return False, f"Missing knowledge for {name}."
-                nationality = (player.nationality or "").lower()
-                if nationality and nationality in q:
-                    continue
-                if "are" in q and nationality and nationality not in q:
-                    return False, f"{name} is not {nationality}."
-            return True, "All players match the nationality constraint."
+        intents = {match.lastgroup for match in self._INTENT_RE.finditer(q)}
+        for intent in self._INTENT_ORDER:
+            if intent in intents:
+                return getattr(self, f"_check_{intent}")(names, q)
 
         return False, "Rule-based checker does not support this question type."
 
+    def _check_world_cup(self, names: Sequence[str], q: str) -> Tuple[bool, str]:
+        for name in names:
+            player = self.knowledge.get(name)
+            if not player:
+                return False, f"Missing knowledge for {name}."
+            if not player.world_cup_years:
+                return False, f"{name} never played in a World Cup."
+        return True, "All players have World Cup appearances."
+
+    def _check_treble(self, names: Sequence[str], q: str) -> Tuple[bool, str]:
+        club = None
+        if "with" in q:
+            club = q.split("with", 1)[1].strip("?.! ")
+        details = []
+        for name in names:
+            player = self.knowledge.get(name)
+            if not player:
+                return False, f"Missing knowledge for {name}."
+            entry = next(
+                (e for e in player.trebles if not club or e.get("club", "").lower() == club),
+                None,
+            )
+            if entry is None:
+                if club:
+                    return False, f"{name} did not win a treble with {club}."
+                return False, f"{name} did not win a treble."
+            details.append(f"{name}: {entry.get('season')}")
+        if club:
+            return True, f"All players won a treble with {club}. " + "; ".join(details)
+        return True, "All players won a treble. " + "; ".join(details)
+
+    def _check_club(self, names: Sequence[str], q: str) -> Tuple[bool, str]:
+        if "played for" in q:
+            club = q.split("played for", 1)[1].strip()
+        else:
+            club = q.split("club", 1)[1].strip()
+        club = club.strip("?.! ")
+        details: List[str] = []
+        for name in names:
+            player = self.knowledge.get(name)
+            if not player:
+                return False, f"Missing knowledge for {name}."
+            if club and club not in player.club_set:
+                return False, f"{name} did not play for {club}."
+            entry = player.club_history_by_club.get(club)
+            if entry is not None:
+                details.append(f"{name}: {entry.get('from')} to {entry.get('to')}")
+        if details:
+            return True, f"All players played for {club}. " + "; ".join(details)
+        return True, f"All players played for {club}."
+
+    def _check_nationality(self, names: Sequence[str], q: str) -> Tuple[bool, str]:
+        for name in names:
+            player = self.knowledge.get(name)
+            if not player:
+                return False, f"Missing knowledge for {name}."
+            nationality = (player.nationality or "").lower()
+            if nationality and nationality in q:
+                continue
+            if "are" in q and nationality and nationality not in q:
+                return False, f"{name} is not {nationality}."
+        return True, "All players match the nationality constraint."
+
 
 class LLMConditionChecker:
     """LLM-backed condition checker using knowledge snippets as context."""
@@ -135,7 +141,7 @@ class LLMConditionChecker:
 
         raw = self.llm.ask(prompt)
         try:
-            payload = json.loads(raw)
+            payload = _loads(raw)
             answer = bool(payload.get("answer"))
             justification = str(payload.get("justification", ""))
             if not justification:
@@ -3,9 +3,29 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import cached_property
 import json
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from names import last_name, normalize
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:  # pragma: no cover - optional speedup
+    HAS_ORJSON = False
+
+
+def _loads(data):
+    """Parse JSON with orjson, retrying with json for what only it accepts (NaN)."""
+    if HAS_ORJSON:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
 
 
 @dataclass
@@ -32,6 +52,24 @@ class Player:
             aliases=list(payload.get("aliases", [])),
         )
 
+    @cached_property
+    def club_set(self) -> frozenset:
+        """Lowercased club names."""
+        return frozenset(c.lower() for c in self.clubs)
+
+    @cached_property
+    def club_history_by_club(self) -> Dict[str, dict]:
+        """First club_history entry per lowercased club name."""
+        entries: Dict[str, dict] = {}
+        for entry in self.club_history:
+            entries.setdefault(entry.get("club", "").lower(), entry)
+        return entries
+
+    @cached_property
+    def trebles(self) -> List[dict]:
+        """Honors entries of type "treble", in their original order."""
+        return [entry for entry in self.honors if entry.get("type") == "treble"]
+
     def as_dict(self) -> dict:
         return {
             "name": self.name,
@@ -64,6 +102,23 @@ class KnowledgeBase:
             names.extend(player.aliases)
         return names
 
+    def name_indexes(self) -> Tuple[Dict[str, str], Dict[str, str]]:
+        """(normalized name -> name, normalized last name -> name) over all_names().
+
+        Built once per knowledge base; pass to DictionaryNameExtractor as
+        prebuilt_index.
+        """
+        return self._name_indexes
+
+    @cached_property
+    def _name_indexes(self) -> Tuple[Dict[str, str], Dict[str, str]]:
+        full: Dict[str, str] = {}
+        last: Dict[str, str] = {}
+        for name in self.all_names():
+            full[normalize(name)] = name
+            last[normalize(last_name(name))] = name
+        return full, last
+
     @staticmethod
     def load(path: Path) -> "KnowledgeBase":
         if not path.exists():
@@ -71,15 +126,16 @@ class KnowledgeBase:
 
         if path.suffix == ".jsonl":
             players = []
-            for line in path.read_text(encoding="utf-8").splitlines():
-                if not line.strip():
-                    continue
-                payload = json.loads(line)
-                name = payload.pop("name")
-                players.append(Player.from_dict(name, payload))
+            with path.open("rb") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    payload = _loads(line)
+                    name = payload.pop("name")
+                    players.append(Player.from_dict(name, payload))
             return KnowledgeBase(players)
 
-        payload = json.loads(path.read_text(encoding="utf-8"))
+        payload = _loads(path.read_bytes())
         if isinstance(payload, list):
             players = []
             for row in payload:
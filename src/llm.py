@@ -2,8 +2,15 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import time
 from dataclasses import dataclass
-from typing import Protocol
+from pathlib import Path
+from typing import Optional, Protocol
 
 
 @dataclass
@@ -22,3 +29,111 @@ class NullLLMClient:
         raise RuntimeError(
             "No LLM configured. Provide an LLM client implementation."
         )
+
+
+class CachingGeminiClient:
+    """Gemini client that caches responses on disk under cache_dir.
+
+    Identical (model, context, prompt) requests are answered from the cache.
+    A static context (e.g. a knowledge JSON blob) is uploaded as Gemini
+    cached content and referenced by every request instead of being resent;
+    it is re-uploaded when context_ttl runs out. If Gemini refuses to cache
+    it (e.g. too few tokens), the context is sent inline with each prompt.
+    """
+
+    def __init__(
+        self,
+        model: str = "gemini-2.0-flash",
+        api_key: Optional[str] = None,
+        cache_dir: Path = Path(".cache") / "llm",
+        context: Optional[str] = None,
+        context_ttl: str = "600s",
+    ) -> None:
+        self.model = model
+        self.api_key = api_key or os.getenv("GOOGLE_API_KEY")
+        self.cache_dir = Path(cache_dir)
+        self.context = context
+        self.context_ttl = context_ttl
+        self._client = None
+        self._cached_content: Optional[str] = None
+        self._cache_expires = 0.0
+        self._cache_failed = False
+
+    def _key(self, prompt: str) -> str:
+        raw = "\0".join((self.model, self.context or "", prompt)).encode("utf-8")
+        return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+    def _get_client(self):
+        if self._client is None:
+            try:
+                from google import genai
+            except ImportError as exc:
+                raise RuntimeError("Install google-genai: pip install google-genai") from exc
+            if not self.api_key:
+                raise RuntimeError("Missing GOOGLE_API_KEY env var for Gemini.")
+            self._client = genai.Client(api_key=self.api_key)
+        return self._client
+
+    def _get_cached_content(self) -> Optional[str]:
+        if self.context is None or self._cache_failed:
+            return None
+        now = time.monotonic()
+        if self._cached_content is None or now >= self._cache_expires:
+            from google.genai import errors, types
+
+            try:
+                cache = self._get_client().caches.create(
+                    model=self.model,
+                    config=types.CreateCachedContentConfig(
+                        contents=[self.context], ttl=self.context_ttl
+                    ),
+                )
+            except errors.APIError as exc:
+                print(
+                    f"Gemini context caching unavailable, sending it inline: {exc}",
+                    file=sys.stderr,
+                )
+                self._cached_content = None
+                self._cache_failed = True
+                return None
+            self._cached_content = cache.name
+            # Renew a little before the server drops it.
+            self._cache_expires = now + 0.9 * float(self.context_ttl.rstrip("s"))
+        return self._cached_content
+
+    def ask(self, prompt: str) -> str:
+        path = self.cache_dir / f"{self._key(prompt)}.json"
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))["response"]
+        except (OSError, ValueError, KeyError):
+            pass
+
+        from google.genai import types
+
+        cached_content = self._get_cached_content()
+        if cached_content is None and self.context is not None:
+            contents = [self.context, prompt]
+        else:
+            contents = prompt
+        response = self._get_client().models.generate_content(
+            model=self.model,
+            contents=contents,
+            config=types.GenerateContentConfig(temperature=0.1, cached_content=cached_content),
+        )
+        usage = getattr(response, "usage_metadata", None)
+        if usage is not None:
+            print(
+                f"Gemini tokens: prompt={usage.prompt_token_count} "
+                f"cached={usage.cached_content_token_count or 0}",
+                file=sys.stderr,
+            )
+        text = response.text or ""
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # A private temp file per writer, so concurrent asks never share one.
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=self.cache_dir, suffix=".tmp", delete=False
+        ) as tmp:
+            json.dump({"model": self.model, "response": text}, tmp, ensure_ascii=False)
+        os.replace(tmp.name, path)
+        return text
@@ -4,14 +4,34 @@ from __future__ import annotations
 
 import re
 from difflib import SequenceMatcher
-from typing import Iterable, List, Dict, Tuple
+from typing import Iterable, List, Dict, Optional, Tuple
+
+try:
+    from rapidfuzz import fuzz, process
+    HAS_RAPIDFUZZ = True
+except ImportError:
+    HAS_RAPIDFUZZ = False
+
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
 
 
 _WORD_RE = re.compile(r"[A-Za-z\-']+")
+_NORM_RE = re.compile(r"[^a-z0-9 ]+")
+# Deletes every ASCII character that _NORM_RE would remove from lowercased text
+_ASCII_DROP = str.maketrans(
+    "", "", "".join(chr(c) for c in range(128) if not re.match(r"[a-z0-9 ]", chr(c)))
+)
 
 
 def normalize(text: str) -> str:
-    return re.sub(r"[^a-z0-9 ]+", "", text.lower()).strip()
+    lowered = text.lower()
+    if lowered.isascii():
+        return lowered.translate(_ASCII_DROP).strip()
+    return _NORM_RE.sub("", lowered).strip()
 
 
 def tokenize(text: str) -> List[str]:
@@ -24,6 +44,18 @@ def last_name(name: str) -> str:
 
 
 def best_fuzzy_match(candidate: str, choices: Iterable[str], cutoff: float) -> Tuple[str, float]:
+    if HAS_RAPIDFUZZ:
+        # Indel-based similarity in C++; scores are 0-100, ours are 0-1.
+        if not isinstance(choices, (list, tuple)):
+            choices = list(choices)
+        hit = process.extractOne(candidate, choices, scorer=fuzz.ratio)
+        if hit is None:
+            return "", 0.0
+        best = (hit[0], hit[1] / 100.0)
+        if best[1] < cutoff:
+            return "", best[1]
+        return best
+
     best = ("", 0.0)
     for choice in choices:
         score = SequenceMatcher(None, candidate, choice).ratio()
@@ -42,34 +74,92 @@ class DictionaryNameExtractor:
         known_names: Iterable[str],
         allow_last_name_only: bool = True,
         fuzzy_cutoff: float = 0.86,
+        prebuilt_index: Optional[Tuple[Dict[str, str], Dict[str, str]]] = None,
     ) -> None:
-        self.known = {normalize(n): n for n in known_names}
+        """prebuilt_index is (normalized name -> name, normalized last name -> name)
+        for known_names, e.g. from KnowledgeBase.name_indexes(); when given the
+        names are not normalized again."""
         self.allow_last_name_only = allow_last_name_only
         self.fuzzy_cutoff = fuzzy_cutoff
-        self._last_name_map: Dict[str, str] = {}
-        if allow_last_name_only:
-            for name in known_names:
-                self._last_name_map[normalize(last_name(name))] = name
+        if prebuilt_index is not None:
+            self.known, last_names = prebuilt_index
+            self._last_name_map: Dict[str, str] = last_names if allow_last_name_only else {}
+        else:
+            known_names = list(known_names)
+            self.known = {normalize(n): n for n in known_names}
+            self._last_name_map = {}
+            if allow_last_name_only:
+                for name in known_names:
+                    self._last_name_map[normalize(last_name(name))] = name
+        self._automaton = self._build_automaton() if HAS_AHOCORASICK else None
+        self._choices: Optional[List[str]] = None
+        self._ngram_sizes: Optional[List[int]] = None
+
+    def _build_automaton(self) -> Optional["ahocorasick.Automaton"]:
+        """Automaton over every key an n-gram of up to 4 tokens can equal.
+
+        Keys are wrapped in spaces so they only match whole tokens of the
+        space-joined transcript; the payload is (token count, name).
+        """
+        targets: Dict[str, str] = {}
+        if self.allow_last_name_only:
+            targets.update(self._last_name_map)
+        targets.update(self.known)
+        automaton = ahocorasick.Automaton()
+        for key, name in targets.items():
+            size = key.count(" ") + 1
+            if key and size <= 4 and "  " not in key:
+                automaton.add_word(f" {key} ", (size, name))
+        if len(automaton) == 0:
+            return None
+        automaton.make_automaton()
+        return automaton
+
+    def _key_sizes(self) -> List[int]:
+        """Token counts (at most 4, longest first) of the dictionary keys."""
+        keys = list(self.known)
+        if self.allow_last_name_only:
+            keys.extend(self._last_name_map)
+        sizes = {key.count(" ") + 1 for key in keys}
+        return [size for size in range(4, 0, -1) if size in sizes]
 
     def extract(self, transcript: str) -> List[str]:
         words = tokenize(transcript)
         lower_words = [normalize(w) for w in words]
         candidates: List[str] = []
 
-        # Try n-grams up to length 4 for full-name matches.
-        for size in range(4, 0, -1):
-            for i in range(0, len(lower_words) - size + 1):
-                chunk = " ".join(lower_words[i : i + size]).strip()
-                if not chunk:
-                    continue
-                if chunk in self.known:
-                    candidates.append(self.known[chunk])
-                elif self.allow_last_name_only and chunk in self._last_name_map:
-                    candidates.append(self._last_name_map[chunk])
+        if self._automaton is not None and all(lower_words):
+            # One pass over the joined tokens; hits are replayed in the order
+            # of the n-gram scan below (longest n-grams first, left to right).
+            joined = " " + " ".join(lower_words) + " "
+            hits = [
+                (-size, end, name)
+                for end, (size, name) in self._automaton.iter(joined)
+            ]
+            hits.sort(key=lambda hit: (hit[0], hit[1]))
+            candidates.extend(name for _, _, name in hits)
+        else:
+            # Try n-grams up to length 4 for full-name matches. Without empty
+            # tokens a chunk of `size` tokens can only equal a key of that many
+            # tokens, so sizes no key has are skipped.
+            if self._ngram_sizes is None:
+                self._ngram_sizes = self._key_sizes()
+            sizes = self._ngram_sizes if all(lower_words) else range(4, 0, -1)
+            for size in sizes:
+                for i in range(0, len(lower_words) - size + 1):
+                    chunk = " ".join(lower_words[i : i + size]).strip()
+                    if not chunk:
+                        continue
+                    if chunk in self.known:
+                        candidates.append(self.known[chunk])
+                    elif self.allow_last_name_only and chunk in self._last_name_map:
+                        candidates.append(self._last_name_map[chunk])
 
         if not candidates and transcript:
             normalized = normalize(transcript)
-            match, score = best_fuzzy_match(normalized, self.known.keys(), self.fuzzy_cutoff)
+            if self._choices is None:
+                self._choices = list(self.known)
+            match, score = best_fuzzy_match(normalized, self._choices, self.fuzzy_cutoff)
             if match:
                 candidates.append(self.known[match])
 
@@ -2,15 +2,50 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import importlib.util
+import itertools
 import os
+import re
 from dataclasses import dataclass
-from typing import Iterable, List, Optional, Protocol, Sequence, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Protocol, Sequence, Tuple, Union
 
+from asr import FasterWhisperTranscriber
 
-@dataclass
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:  # pragma: no cover - optional speedup
+    HAS_NUMPY = False
+
+try:
+    import ahocorasick
+
+    HAS_AHOCORASICK = True
+except ImportError:  # pragma: no cover - optional speedup
+    HAS_AHOCORASICK = False
+
+# Checked once without importing: loading whisper pulls in torch.
+HAS_WHISPER = importlib.util.find_spec("whisper") is not None
+HAS_FASTER_WHISPER = importlib.util.find_spec("faster_whisper") is not None
+HAS_SILERO_VAD = importlib.util.find_spec("silero_vad") is not None
+HAS_ONNX_WHISPER = (
+    importlib.util.find_spec("onnxruntime") is not None
+    and importlib.util.find_spec("optimum") is not None
+)
+DEFAULT_DUMMY_TRANSCRIPT = "Lionel Messi, Cristiano Ronaldo, Neymar."
+
+
+def _dummy_transcript() -> str:
+    return os.environ.get("DUMMY_TRANSCRIPT", DEFAULT_DUMMY_TRANSCRIPT)
+
+
+@dataclass(slots=True, frozen=True)
 class PipelineResult:
     transcript: str
-    names: List[str]
+    names: Tuple[str, ...]
     condition_ok: bool
     condition_details: str
 
@@ -30,28 +65,318 @@ class ConditionChecker(Protocol):
         """Return (ok, details) if names satisfy the question."""
 
 
+@functools.lru_cache(maxsize=4)
+def _load_whisper(model_size: str, half: bool = False):
+    """Load a Whisper model once per (size, half) and reuse it across transcribers.
+
+    With half=True the weights are converted to FP16 once when the model is on
+    a GPU, instead of being cast on every forward pass.
+    """
+    import whisper  # type: ignore
+
+    model = whisper.load_model(model_size)
+    if half and model.device.type == "cuda":
+        model = model.half()
+    return model
+
+
+@functools.lru_cache(maxsize=1)
+def _load_vad():
+    from silero_vad import load_silero_vad  # type: ignore
+
+    return load_silero_vad()
+
+
+def _crop_to_speech(audio, min_silence_ms: int):
+    """Keep only the speech regions Silero VAD finds in 16 kHz mono audio."""
+    import torch  # type: ignore
+    from silero_vad import collect_chunks, get_speech_timestamps  # type: ignore
+
+    wav = audio if isinstance(audio, torch.Tensor) else torch.from_numpy(audio)
+    stamps = get_speech_timestamps(
+        wav, _load_vad(), sampling_rate=16000, min_silence_duration_ms=min_silence_ms
+    )
+    if not stamps:
+        return wav[:0]
+    return collect_chunks(stamps, wav)
+
+
 class WhisperTranscriber:
     """Optional Whisper-based transcriber.
 
-    Uses openai-whisper if available. Falls back to raising an error if missing.
+    Uses openai-whisper if available. Falls back to DUMMY_TRANSCRIPT if missing.
+    precision is "fp16" (GPU only; CPU runs FP32), "fp32", or "int8", which
+    runs the same model size and decoding options through faster-whisper
+    when it is installed. With vad=True (and silero-vad installed, or through
+    faster-whisper's own VAD for int8) silences of at least min_silence_ms
+    are cut out before decoding.
+
+    Decoding defaults to a single greedy pass (temperature 0, no conditioning
+    on previous text); pass a tuple of temperatures to restore Whisper's
+    fallback retries on noisy audio.
     """
 
-    def __init__(self, model_size: str = "small") -> None:
+    def __init__(
+        self,
+        model_size: str = "small",
+        precision: str = "fp16",
+        vad: bool = False,
+        min_silence_ms: int = 500,
+        temperature: Union[float, Tuple[float, ...]] = 0.0,
+        beam_size: int = 1,
+        best_of: int = 1,
+        condition_on_previous_text: bool = False,
+        no_speech_threshold: Optional[float] = 0.6,
+    ) -> None:
+        if precision not in ("fp32", "fp16", "int8"):
+            raise ValueError(f"Unknown precision: {precision}")
         self.model_size = model_size
+        self.precision = precision
+        self.vad = vad
+        self.min_silence_ms = min_silence_ms
+        self.temperature = temperature
+        self.beam_size = beam_size
+        self.best_of = best_of
+        self.condition_on_previous_text = condition_on_previous_text
+        self.no_speech_threshold = no_speech_threshold
+
+    def _load(self):
+        model = _load_whisper(self.model_size, half=self.precision == "fp16")
+        return model, self.precision == "fp16" and model.device.type == "cuda"
+
+    def _faster_whisper(self) -> FasterWhisperTranscriber:
+        options: Dict[str, object] = {
+            "temperature": self.temperature,
+            "beam_size": self.beam_size,
+            "best_of": self.best_of,
+            "condition_on_previous_text": self.condition_on_previous_text,
+            "no_speech_threshold": self.no_speech_threshold,
+            "vad_filter": self.vad,
+        }
+        if self.vad:
+            options["vad_parameters"] = {"min_silence_duration_ms": self.min_silence_ms}
+        return FasterWhisperTranscriber(self.model_size, compute_type="int8", options=options)
+
+    def _transcribe_options(self, fp16: bool) -> Dict[str, object]:
+        options: Dict[str, object] = {
+            "temperature": self.temperature,
+            "condition_on_previous_text": self.condition_on_previous_text,
+            "no_speech_threshold": self.no_speech_threshold,
+            "fp16": fp16,
+        }
+        # Left out at 1 so temperature 0 decodes greedily, as in _decoding_options,
+        # rather than with a one-beam BeamSearchDecoder.
+        if self.beam_size > 1:
+            options["beam_size"] = self.beam_size
+        if self.best_of > 1:
+            options["best_of"] = self.best_of
+        return options
+
+    def _decoding_options(self, whisper, fp16: bool):
+        """DecodingOptions for one batched pass at the first temperature."""
+        temperature = (
+            self.temperature if isinstance(self.temperature, (int, float)) else self.temperature[0]
+        )
+        # Whisper rejects best_of with greedy decoding and beam_size with sampling.
+        if temperature == 0:
+            beam_size = self.beam_size if self.beam_size > 1 else None
+            return whisper.DecodingOptions(temperature=0.0, beam_size=beam_size, fp16=fp16)
+        return whisper.DecodingOptions(temperature=temperature, best_of=self.best_of, fp16=fp16)
 
     def transcribe(self, audio_path: str) -> str:
-        try:
+        if self.precision == "int8" and HAS_FASTER_WHISPER:
+            return self._faster_whisper().transcribe(audio_path)
+        if not HAS_WHISPER:  # pragma: no cover - environment dependent
+            return _dummy_transcript()
+
+        model, fp16 = self._load()
+        audio = audio_path
+        if self.vad and HAS_SILERO_VAD:
             import whisper  # type: ignore
-        except ImportError:  # pragma: no cover - environment dependent
-            return os.environ.get(
-                "DUMMY_TRANSCRIPT",
-                "Lionel Messi, Cristiano Ronaldo, Neymar.",
-            )
-
-        model = whisper.load_model(self.model_size)
-        result = model.transcribe(audio_path)
+
+            if isinstance(audio, str):
+                audio = whisper.load_audio(audio)
+            audio = _crop_to_speech(audio, self.min_silence_ms)
+            if not len(audio):
+                return ""
+        result = model.transcribe(audio, **self._transcribe_options(fp16))
         return result.get("text", "").strip()
 
+    def transcribe_batch(self, audio_paths: Sequence[str]) -> List[str]:
+        """Transcribe several files, decoding clips of up to 30 s as one batch.
+
+        Longer clips need Whisper's sliding window and go through transcribe().
+        """
+        if self.precision == "int8" and HAS_FASTER_WHISPER:
+            transcriber = self._faster_whisper()
+            return [transcriber.transcribe(path) for path in audio_paths]
+        if not HAS_WHISPER:  # pragma: no cover - environment dependent
+            return [_dummy_transcript() for _ in audio_paths]
+        import torch  # type: ignore
+        import whisper  # type: ignore
+
+        model, fp16 = self._load()
+
+        audios = [whisper.load_audio(path) for path in audio_paths]
+        if self.vad and HAS_SILERO_VAD:
+            audios = [_crop_to_speech(audio, self.min_silence_ms) for audio in audios]
+        texts: List[str] = [""] * len(audios)
+        # Clips without speech keep an empty transcript.
+        short = [
+            i for i, audio in enumerate(audios) if 0 < len(audio) <= whisper.audio.N_SAMPLES
+        ]
+        if short:
+            mels = torch.stack(
+                [
+                    whisper.log_mel_spectrogram(
+                        whisper.pad_or_trim(audios[i]), model.dims.n_mels
+                    )
+                    for i in short
+                ]
+            ).to(model.device)
+            options = self._decoding_options(whisper, fp16)
+            for i, decoded in zip(short, model.decode(mels, options)):
+                # transcribe()'s no-speech gate (with its default logprob_threshold).
+                if (
+                    self.no_speech_threshold is not None
+                    and decoded.no_speech_prob > self.no_speech_threshold
+                    and decoded.avg_logprob <= -1.0
+                ):
+                    continue
+                texts[i] = decoded.text.strip()
+        for i, audio in enumerate(audios):
+            if len(audio) > whisper.audio.N_SAMPLES:
+                result = model.transcribe(audio, **self._transcribe_options(fp16))
+                texts[i] = result.get("text", "").strip()
+        return texts
+
+
+@functools.lru_cache(maxsize=2)
+def _load_onnx_whisper(model_size: str, provider: str, cache_dir: str):
+    """Load an ONNX Runtime Whisper pipeline once per (size, provider), warmed up.
+
+    The encoder/decoder are exported to ONNX on first use and saved under
+    cache_dir, so later processes only create the sessions.
+    """
+    import numpy as np  # type: ignore
+    import onnxruntime as ort  # type: ignore
+    from optimum.onnxruntime import ORTModelForSpeechSeq2Seq  # type: ignore
+    from transformers import AutoProcessor, pipeline  # type: ignore
+
+    model_id = f"openai/whisper-{model_size}"
+    export_dir = os.path.join(cache_dir, f"whisper-{model_size}")
+    options = ort.SessionOptions()
+    options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    exported = os.path.isdir(export_dir)
+    model = ORTModelForSpeechSeq2Seq.from_pretrained(
+        export_dir if exported else model_id,
+        export=not exported,
+        provider=provider,
+        session_options=options,
+    )
+    processor = AutoProcessor.from_pretrained(export_dir if exported else model_id)
+    if not exported:
+        model.save_pretrained(export_dir)
+        processor.save_pretrained(export_dir)
+    asr = pipeline(
+        "automatic-speech-recognition",
+        model=model,
+        tokenizer=processor.tokenizer,
+        feature_extractor=processor.feature_extractor,
+    )
+    # One second of silence, so the first real call doesn't pay for allocation.
+    asr(np.zeros(16000, dtype=np.float32))
+    return asr
+
+
+class OnnxWhisperTranscriber:
+    """Optional Whisper transcriber running on ONNX Runtime.
+
+    Uses optimum's ONNX export of the model; the sessions are built with full
+    graph optimization on the first available of CUDA, OpenVINO or CPU.
+    Falls back to DUMMY_TRANSCRIPT if onnxruntime or optimum is missing.
+    """
+
+    def __init__(
+        self,
+        model_size: str = "small",
+        provider: Optional[str] = None,
+        cache_dir: str = os.path.join(".cache", "onnx"),
+    ) -> None:
+        self.model_size = model_size
+        self.provider = provider
+        self.cache_dir = cache_dir
+
+    def _provider(self) -> str:
+        if self.provider:
+            return self.provider
+        import onnxruntime as ort  # type: ignore
+
+        available = ort.get_available_providers()
+        for provider in ("CUDAExecutionProvider", "OpenVINOExecutionProvider"):
+            if provider in available:
+                return provider
+        return "CPUExecutionProvider"
+
+    def transcribe(self, audio_path: str) -> str:
+        if not HAS_ONNX_WHISPER:  # pragma: no cover - environment dependent
+            return _dummy_transcript()
+
+        asr = _load_onnx_whisper(self.model_size, self._provider(), self.cache_dir)
+        return asr(audio_path, return_timestamps=True).get("text", "").strip()
+
+
+def _capitalized_runs(transcript: str) -> Iterator[str]:
+    """Runs of capitalized tokens, each joined into one candidate name."""
+    buffer: List[str] = []
+    # Capitalized tokens keep their first character after stripping, so a
+    # non-empty buffer always joins to a non-empty, unpadded candidate.
+    for token in transcript.replace("-", " ").split():
+        if token[:1].isupper():
+            buffer.append(token.strip(",.?!;:"))
+        elif buffer:
+            yield " ".join(buffer)
+            buffer = []
+    if buffer:
+        yield " ".join(buffer)
+
+
+# Byte classes for the vectorized scan: 0 separator (str.split whitespace or
+# "-"), 2 uppercase letter, 1 anything else.
+_BYTE_KIND = bytearray([1]) * 256
+for _byte in b" \t\n\v\f\r\x1c\x1d\x1e\x1f-":
+    _BYTE_KIND[_byte] = 0
+for _byte in range(ord("A"), ord("Z") + 1):
+    _BYTE_KIND[_byte] = 2
+_BYTE_KIND = bytes(_BYTE_KIND)
+# Below this length the per-token loop is faster than the NumPy setup cost.
+_NUMPY_MIN_CHARS = 4096
+
+
+def _capitalized_runs_numpy(transcript: str) -> List[str]:
+    """Capitalized token runs of an ASCII transcript, found with NumPy.
+
+    Token boundaries and capitalization are computed for the whole string at
+    once; Python only touches the capitalized tokens.
+    """
+    kind = np.frombuffer(transcript.encode("ascii").translate(_BYTE_KIND), dtype=np.int8)
+    is_token = np.zeros(len(kind) + 2, dtype=np.int8)
+    is_token[1:-1] = kind != 0
+    edges = np.diff(is_token)
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    capitalized = np.flatnonzero(kind[starts] == 2)
+    if not len(capitalized):
+        return []
+    # A run breaks wherever the previous capitalized token is not the previous token.
+    breaks = np.flatnonzero(np.diff(capitalized, prepend=-2) != 1).tolist()
+    breaks.append(len(capitalized))
+    words = [
+        transcript[start:end].rstrip(",.?!;:")
+        for start, end in zip(starts[capitalized].tolist(), ends[capitalized].tolist())
+    ]
+    return [" ".join(words[a:b]) for a, b in zip(breaks, breaks[1:])]
+
 
 class SimpleNameExtractor:
     """Heuristic extractor that treats capitalized word runs as names.
@@ -61,42 +386,56 @@ class SimpleNameExtractor:
 
     def __init__(self, known_names: Optional[Iterable[str]] = None) -> None:
         self.known_names = {n.lower(): n for n in (known_names or [])}
+        self._displays = list(self.known_names.values())
+        # "" is a substring of every transcript but can't go in the automaton.
+        self._empty_key_index: Optional[int] = (
+            list(self.known_names).index("") if "" in self.known_names else None
+        )
+        self._automaton = self._build_automaton() if HAS_AHOCORASICK else None
+
+    def _build_automaton(self) -> Optional["ahocorasick.Automaton"]:
+        """Automaton over the known-name keys; the payload is the key's position."""
+        if not any(self.known_names):
+            return None
+        automaton = ahocorasick.Automaton()
+        for index, key in enumerate(self.known_names):
+            if key:
+                automaton.add_word(key, index)
+        automaton.make_automaton()
+        return automaton
 
     def extract(self, transcript: str) -> List[str]:
-        tokens = transcript.replace("-", " ").split()
-        names: List[str] = []
-        buffer: List[str] = []
-
-        def flush_buffer() -> None:
-            if not buffer:
-                return
-            candidate = " ".join(buffer).strip()
-            if not candidate:
-                return
-            names.append(candidate)
-            buffer.clear()
+        return list(self.iter_extract(transcript))
 
-        for token in tokens:
-            if token[:1].isupper():
-                buffer.append(token.strip(",.?!;:"))
-            else:
-                flush_buffer()
-        flush_buffer()
-
-        if not names and self.known_names:
-            for key, display in self.known_names.items():
-                if key in transcript.lower():
-                    names.append(display)
+    def iter_extract(self, transcript: str) -> Iterator[str]:
+        """Yield the extracted names one at a time, scanning lazily where possible."""
+        if HAS_NUMPY and len(transcript) >= _NUMPY_MIN_CHARS and transcript.isascii():
+            runs: Iterable[str] = _capitalized_runs_numpy(transcript)
+        else:
+            runs = _capitalized_runs(transcript)
 
-        # Deduplicate while preserving order.
+        # Deduplicate case-insensitively, keeping the first spelling in order.
         seen = set()
-        unique: List[str] = []
-        for name in names:
+        for name in runs:
             key = name.lower()
             if key not in seen:
-                unique.append(name)
                 seen.add(key)
-        return unique
+                yield name
+
+        # Known names are only a fallback; their keys are already unique.
+        if not seen and self.known_names:
+            lower = transcript.lower()
+            if self._automaton is not None:
+                # One pass over the transcript; yield in known_names order as before.
+                found = {index for _end, index in self._automaton.iter(lower)}
+                if self._empty_key_index is not None:
+                    found.add(self._empty_key_index)
+                for index in sorted(found):
+                    yield self._displays[index]
+                return
+            for key, display in self.known_names.items():
+                if key in lower:
+                    yield display
 
 
 class RuleBasedConditionChecker:
@@ -106,44 +445,114 @@ class RuleBasedConditionChecker:
     Example attributes: {"nationality": "Brazil", "clubs": ["Barcelona"]}
     """
 
+    # Question keywords, all found in one scan (no keyword can overlap another).
+    _KEYWORD_RE = re.compile(
+        r"(?P<national>national)|(?P<are>are)|(?P<played_for>played for)|(?P<club>club)"
+    )
+
     def __init__(self, knowledge: dict) -> None:
         self.knowledge = {k.lower(): v for k, v in knowledge.items()}
+        # Lowercased lookups per player; players with empty attributes are
+        # treated as missing knowledge.
+        self._nationality: Dict[str, str] = {
+            k: (v.get("nationality") or "").lower() for k, v in self.knowledge.items() if v
+        }
+        self._clubs: Dict[str, frozenset] = {
+            k: frozenset(c.lower() for c in v.get("clubs", []))
+            for k, v in self.knowledge.items()
+            if v
+        }
+        # Results only depend on the indexes above, which never change, so
+        # repeated (names, question) pairs are answered from a per-instance cache.
+        self._check_cached = functools.lru_cache(maxsize=1024)(self._check)
 
     def check(self, names: Sequence[str], question: str) -> Tuple[bool, str]:
         if not names:
             return False, "No names extracted from transcript."
+        return self._check_cached(tuple(names), question.lower().strip())
 
-        q = question.lower().strip()
+    def _check(self, names: Tuple[str, ...], q: str) -> Tuple[bool, str]:
         if "all" not in q:
             return False, "Question must include an 'all' constraint."
 
+        check_nationality, has_are, club = self._parse_question(q)
+        keys = [name.lower() for name in names]
+
         # Simple patterns: "all are <nationality>", "all played for <club>"
-        if "national" in q or "are" in q:
-            for name in names:
-                attrs = self.knowledge.get(name.lower())
-                if not attrs:
-                    return False, f"Missing knowledge for {name}."
-                nationality = attrs.get("nationality", "").lower()
-                if nationality and nationality in q:
-                    continue
-                if "are" in q and nationality and nationality not in q:
-                    return False, f"{name} is not {nationality}."
+        if check_nationality:
+            for name, key in zip(names, keys):
+                error = self._nationality_error(name, key, q, has_are)
+                if error:
+                    return False, error
+
+        if club is not None:
+            for name, key in zip(names, keys):
+                error = self._club_error(name, key, club)
+                if error:
+                    return False, error
+
+        return True, "All names satisfy the question based on knowledge."
+
+    def check_stream(self, names: Iterable[str], question: str) -> Tuple[bool, str]:
+        """check() over names read one at a time, stopping once the answer is known.
+
+        Gives the same answer as check() on the full list. Nationality errors
+        take precedence, so a club error only ends the scan early when
+        nationality is not being checked.
+        """
+        names = iter(names)
+        first = next(names, None)
+        if first is None:
+            return False, "No names extracted from transcript."
+
+        q = question.lower().strip()
+        if "all" not in q:
+            return False, "Question must include an 'all' constraint."
 
-        if "played for" in q or "club" in q:
-            if "played for" in q:
+        check_nationality, has_are, club = self._parse_question(q)
+        club_error: Optional[str] = None
+        for name in itertools.chain((first,), names):
+            key = name.lower()
+            if check_nationality:
+                error = self._nationality_error(name, key, q, has_are)
+                if error:
+                    return False, error
+            if club is not None and club_error is None:
+                club_error = self._club_error(name, key, club)
+                if club_error and not check_nationality:
+                    return False, club_error
+        if club_error:
+            return False, club_error
+        return True, "All names satisfy the question based on knowledge."
+
+    def _parse_question(self, q: str) -> Tuple[bool, bool, Optional[str]]:
+        """(check nationality, question has "are", club to check or None)."""
+        keywords = {match.lastgroup for match in self._KEYWORD_RE.finditer(q)}
+        has_are = "are" in keywords
+        club = None
+        if "played_for" in keywords or "club" in keywords:
+            if "played_for" in keywords:
                 club = q.split("played for", 1)[1].strip()
             else:
                 club = q.split("club", 1)[1].strip()
             club = club.strip("?.! ")
-            for name in names:
-                attrs = self.knowledge.get(name.lower())
-                if not attrs:
-                    return False, f"Missing knowledge for {name}."
-                clubs = [c.lower() for c in attrs.get("clubs", [])]
-                if club and club.lower() not in clubs:
-                    return False, f"{name} did not play for {club}."
+        return has_are or "national" in keywords, has_are, club
 
-        return True, "All names satisfy the question based on knowledge."
+    def _nationality_error(self, name: str, key: str, q: str, has_are: bool) -> Optional[str]:
+        nationality = self._nationality.get(key)
+        if nationality is None:
+            return f"Missing knowledge for {name}."
+        if has_are and nationality and nationality not in q:
+            return f"{name} is not {nationality}."
+        return None
+
+    def _club_error(self, name: str, key: str, club: str) -> Optional[str]:
+        clubs = self._clubs.get(key)
+        if clubs is None:
+            return f"Missing knowledge for {name}."
+        if club and club not in clubs:
+            return f"{name} did not play for {club}."
+        return None
 
 
 class Pipeline:
@@ -158,12 +567,74 @@ class Pipeline:
         self.checker = checker
 
     def run(self, audio_path: str, question: str) -> PipelineResult:
+        return self._evaluate(self.transcriber.transcribe(audio_path), question)
+
+    def run_many(self, audio_paths: Sequence[str], question: str) -> List[PipelineResult]:
+        """Run the pipeline over several files, batching transcription when supported."""
+        transcribe_batch = getattr(self.transcriber, "transcribe_batch", None)
+        if transcribe_batch is not None:
+            transcripts = transcribe_batch(audio_paths)
+        else:
+            transcripts = [self.transcriber.transcribe(path) for path in audio_paths]
+        return [self._evaluate(transcript, question) for transcript in transcripts]
+
+    def run_fused(self, audio_path: str, question: str) -> PipelineResult:
+        """Like run(), but names are checked as they are extracted.
+
+        Needs an extractor with iter_extract and a checker with check_stream;
+        otherwise falls back to run(). Extraction stops as soon as the answer
+        is known, so `names` holds only the names read up to that point.
+        """
         transcript = self.transcriber.transcribe(audio_path)
+        iter_extract = getattr(self.extractor, "iter_extract", None)
+        check_stream = getattr(self.checker, "check_stream", None)
+        if iter_extract is None or check_stream is None:
+            return self._evaluate(transcript, question)
+
+        names: List[str] = []
+
+        def read_names() -> Iterator[str]:
+            for name in iter_extract(transcript):
+                names.append(name)
+                yield name
+
+        ok, details = check_stream(read_names(), question)
+        return PipelineResult(
+            transcript=transcript,
+            names=tuple(names),
+            condition_ok=ok,
+            condition_details=details,
+        )
+
+    async def run_many_async(
+        self, audio_paths: Sequence[str], question: str, prefetch: int = 1
+    ) -> List[PipelineResult]:
+        """Run several files, transcribing ahead while earlier transcripts are checked.
+
+        Up to `prefetch` transcriptions run at once if the transcriber has
+        transcribe_async. Plain transcribe() calls share one cached model that
+        is not thread-safe, so they run one at a time in a worker thread.
+        Extraction and checking run on the event loop in input order.
+        """
+        semaphore = asyncio.Semaphore(max(1, prefetch))
+        thread_lock = asyncio.Lock()
+
+        async def transcribe(path: str) -> str:
+            async with semaphore:
+                if hasattr(self.transcriber, "transcribe_async"):
+                    return await self.transcriber.transcribe_async(path)
+                async with thread_lock:
+                    return await asyncio.to_thread(self.transcriber.transcribe, path)
+
+        tasks = [asyncio.create_task(transcribe(path)) for path in audio_paths]
+        return [self._evaluate(await task, question) for task in tasks]
+
+    def _evaluate(self, transcript: str, question: str) -> PipelineResult:
         names = self.extractor.extract(transcript)
         ok, details = self.checker.check(names, question)
         return PipelineResult(
             transcript=transcript,
-            names=names,
+            names=tuple(names),
             condition_ok=ok,
             condition_details=details,
         )